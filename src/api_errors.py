@@ -0,0 +1,46 @@
+"""
+Retry classification for NBA API failures
+
+Shared by the endpoint processor, the NBA data processor and the master
+tables manager, so the same exception gets the same retry decision everywhere.
+"""
+
+import json
+
+import requests
+
+# Errors that retrying the same request can't fix: empty/malformed JSON body,
+# missing result sets, nba_api choking on a None response, or a bad call signature
+PERMANENT_ERROR_TYPES = (json.JSONDecodeError, IndexError, AttributeError, KeyError, TypeError)
+PERMANENT_ERROR_INDICATORS = (
+    'invalid game id', 'invalid player id', 'invalid team id',
+    'bad request', '400', '401', '403', 'unauthorized', 'forbidden',
+    'parameter', 'invalid parameter', 'missing required',
+)
+
+
+def is_permanent_api_error(error):
+    """
+    Decide whether an API failure is worth retrying
+
+    Dispatches on the exception type first; only errors that carry no usable
+    type (API-side rejections) fall back to scanning the message.
+    """
+    if isinstance(error, PERMANENT_ERROR_TYPES):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return 400 <= status < 500 and status != 429
+    if isinstance(error, requests.exceptions.RequestException):
+        return False  # Timeouts, dropped connections, 5xx - all transient
+    error_str = str(error).lower()
+    return any(indicator in error_str for indicator in PERMANENT_ERROR_INDICATORS)
+
+
+def is_throttle_error(error):
+    """Timeouts and 429s mean we're pushing the API too hard"""
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code == 429
+    return '429' in str(error)
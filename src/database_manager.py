@@ -10,26 +10,32 @@ This system creates and maintains master tables in PostgreSQL RDS for all league
 Based on league_separated_collection.py with RDS integration.
 """
 
+import argparse
 import pandas as pd
 import time
 import os
 import sys
 import json
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import numpy as np
 import psycopg2
-from psycopg2.extras import execute_batch
+from psycopg2.extras import execute_values
 from psycopg2 import sql
 import re
+import requests
+from requests.adapters import HTTPAdapter
 
 # NBA API imports
 from nba_api.stats.endpoints import leaguegamefinder
 import nba_api.stats.endpoints as nbaapi
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.static import teams, players
 
 # Add path to access archive modules
-import sys
-import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'archive'))
 
 # Try to import rds_connection_manager for database functions
@@ -41,11 +47,81 @@ except ImportError:
     print("⚠️  Warning: RDS Connection Manager not available, using basic psycopg2 connection")
     USE_RDS_MANAGER = False
 
+from api_errors import is_permanent_api_error
+from response_cache import CURRENT_SEASON_TTL, DEFAULT_TTL, load_cached_response, save_cached_response
+
+logger = logging.getLogger(__name__)
+
+API_REQUESTS_PER_MINUTE = 33   # Combined budget for every league and worker thread (same as the processor's)
+API_CALL_INTERVAL = 60 / API_REQUESTS_PER_MINUTE  # Minimum seconds between the starts of consecutive calls
+API_MAX_ATTEMPTS = 3      # Attempts per call when the API is throttling or timing out
+API_BACKOFF_CAP = 30      # Longest back-off between those attempts, in seconds
+UPSERT_PAGE_SIZE = 1000   # Rows per multi-row upsert statement
+
+
+class ApiThrottle:
+    """
+    Spaces NBA API calls from all worker threads at least interval apart
+    
+    One instance is shared by every league and worker, so interval caps the
+    combined request rate, not the rate per thread.
+    
+    Each caller reserves the next free start slot under the lock and sleeps
+    outside it, so a slow response never holds up the other workers.
+    """
+    
+    def __init__(self, interval=API_CALL_INTERVAL):
+        self.interval = interval
+        self.next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until this caller's start slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    One JSON object per log record, for CI log parsers
+    
+    Fields passed as extra={'event': {...}} are merged into the object, so
+    per-season counts can be aggregated without parsing the message text.
+    """
+    
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'message': record.getMessage().strip()
+        }
+        entry.update(getattr(record, 'event', {}))
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def _repeat_category(values, lengths):
+    """Categorical column holding values[i] for lengths[i] consecutive rows"""
+    categories = list(dict.fromkeys(values))
+    codes = np.repeat([categories.index(value) for value in values], lengths)
+    return pd.Categorical.from_codes(codes.astype('int16'), categories)
+
 
 class MasterTablesManager:
     """Manages NBA master tables in PostgreSQL RDS with incremental updates"""
     
-    def __init__(self, db_config=None):
+    def __init__(self, db_config=None, api_workers=4, use_cache=True):
+        # Concurrent NBA API calls per league; the shared throttle caps the combined rate
+        self.api_workers = max(1, api_workers)
+        self.api_throttle = ApiThrottle()
+        # Finished seasons never change, so their responses are reused from disk
+        self.use_cache = use_cache
+        self._league_seasons = {}  # league name -> seasons up to now, built on first use
         self.db_config = db_config or {
             'database': 'thebigone',
             'user': 'ajwin', 
@@ -54,8 +130,9 @@ class MasterTablesManager:
             'port': 5432
         }
         
-        # League configurations with proper season formatting and realistic start years
-        self.league_configs = [
+        # League configurations with proper season formatting and realistic start years.
+        # Tuples: worker threads iterate these while collection runs.
+        self.league_configs = (
             {
                 'id': '00', 
                 'name': 'NBA', 
@@ -77,15 +154,24 @@ class MasterTablesManager:
                 'season_format': 'two_year',  # 2023-24 format
                 'start_year': 2001  # G-League data available from 2001
             }
-        ]
-        
-        # Season types to collect
-        self.season_types = [
-            {'type': 'Regular Season', 'name': 'regular'},
-            {'type': 'Playoffs', 'name': 'playoffs'},
-            {'type': 'Pre Season', 'name': 'preseason'},
-            {'type': 'IST', 'name': 'in_season_tournament'}
-        ]
+        )
+        
+        # Season types to collect. game_id_code is the GAME_ID digit that identifies
+        # the type, so those types share one request per season; IST group games
+        # carry the regular-season code and need their own request.
+        self.season_types = (
+            {'type': 'Regular Season', 'name': 'regular', 'game_id_code': '2'},
+            {'type': 'Playoffs', 'name': 'playoffs', 'game_id_code': '4'},
+            {'type': 'Pre Season', 'name': 'preseason', 'game_id_code': '1'},
+            {'type': 'IST', 'name': 'in_season_tournament', 'game_id_code': None}
+        )
+        # Split once here rather than for every league
+        self._coded_season_types = tuple(
+            (cfg['type'], cfg['game_id_code']) for cfg in self.season_types if cfg['game_id_code']
+        )
+        self._separate_season_types = tuple(
+            cfg['type'] for cfg in self.season_types if not cfg['game_id_code']
+        )
         
         # Master table definitions
         self.master_tables = {
@@ -106,6 +192,18 @@ class MasterTablesManager:
             }
         }
         
+        self.reset_api_session()
+        
+    def reset_api_session(self):
+        """Install a fresh pooled session on nba_api, dropping any stale sockets"""
+        # Every league's workers can be mid-request at once
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=len(self.league_configs) * self.api_workers)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # In-flight calls keep the session they already hold; new calls get this one
+        NBAStatsHTTP.set_session(session)
+    
     def connect_to_database(self):
         """Connect to PostgreSQL RDS database"""
         try:
@@ -125,10 +223,10 @@ class MasterTablesManager:
                     host=self.db_config['host'],
                     port=self.db_config['port']
                 )
-                print("Connected to RDS PostgreSQL database")
+                logger.info("Connected to RDS PostgreSQL database")
             return conn
         except Exception as e:
-            print(f"Error connecting to database: {str(e)}")
+            logger.error("Error connecting to database: %s", e)
             return None
     
     def clean_column_names(self, df):
@@ -289,7 +387,7 @@ class MasterTablesManager:
             cursor.execute(time_index_query)
         
         conn.commit()
-        print(f"✓ Table {table_name} created with indexes")
+        logger.info("✓ Table %s created with indexes", table_name)
         
     def get_last_update_time(self, conn, table_name, table_type):
         """Get the last update timestamp for incremental updates"""
@@ -302,20 +400,26 @@ class MasterTablesManager:
             result = cursor.fetchone()[0]
             
             if result:
-                print(f"Last update for {table_name}: {result}")
+                logger.info("Last update for %s: %s", table_name, result)
                 return result
             else:
-                print(f"No previous data found for {table_name}")
+                logger.info("No previous data found for %s", table_name)
                 return None
                 
         except Exception as e:
-            print(f"Error getting last update time for {table_name}: {str(e)}")
+            logger.error("Error getting last update time for %s: %s", table_name, e)
             return None
     
     def generate_seasons_by_league(self, league_config, end_year=None):
-        """Generate seasons based on league-specific format"""
+        """Generate seasons based on league-specific format (callers must not modify the list)"""
         if end_year is None:
-            end_year = datetime.now().year + 1
+            # Games and players collection both need this list for every league
+            league_name = league_config['name']
+            if league_name not in self._league_seasons:
+                self._league_seasons[league_name] = self.generate_seasons_by_league(
+                    league_config, datetime.now().year + 1
+                )
+            return self._league_seasons[league_name]
             
         seasons = []
         start_year = league_config['start_year']
@@ -323,7 +427,7 @@ class MasterTablesManager:
         if league_config['season_format'] == 'two_year':
             # NBA/G-League format: 2023-24
             for year in range(start_year, end_year):
-                season_str = f"{year}-{str(year+1)[2:].zfill(2)}"
+                season_str = f"{year}-{(year+1) % 100:02d}"
                 seasons.append(season_str)
         else:
             # WNBA format: 2024
@@ -332,12 +436,105 @@ class MasterTablesManager:
         
         return seasons[::-1]  # Most recent first
     
+    def _call_nba_api(self, request):
+        """
+        Run one throttled NBA API request, retrying only transient failures
+        
+        Args:
+            request: Zero-argument callable that performs the call
+        
+        Returns:
+            tuple: (result, None) on success, (None, exception) on failure
+        """
+        for attempt in range(API_MAX_ATTEMPTS):
+            self.api_throttle.wait()
+            try:
+                return request(), None
+            except Exception as e:
+                # A timed-out or dropped connection can poison the shared session
+                if isinstance(e, requests.exceptions.RequestException):
+                    self.reset_api_session()
+                if is_permanent_api_error(e) or attempt == API_MAX_ATTEMPTS - 1:
+                    return None, e
+                # Jittered so the league workers don't all retry in the same instant
+                time.sleep(random.uniform(1, min(2 ** (attempt + 1), API_BACKOFF_CAP)))
+    
+    def _call_nba_api_cached(self, endpoint_name, params, season, request):
+        """
+        _call_nba_api behind the on-disk response cache
+        
+        Seasons that may still be in progress expire after a few hours;
+        older seasons are reused for DEFAULT_TTL.
+        """
+        ttl = None
+        if self.use_cache:
+            open_season = int(season[:4]) >= datetime.now().year - 1
+            ttl = CURRENT_SEASON_TTL if open_season else DEFAULT_TTL
+        
+        cached = load_cached_response(endpoint_name, params, ttl, logger)
+        if cached is not None:
+            return cached, None
+        
+        result, error = self._call_nba_api(request)
+        if error is None and self.use_cache:
+            save_cached_response(endpoint_name, params, result, logger)
+        return result, error
+    
+    def _fetch_league_games(self, league_id, season, season_type=None):
+        """
+        Fetch one season of games from LeagueGameFinder (runs on a worker thread)
+        
+        Args:
+            season_type: Restrict to one season type; None returns every type
+        """
+        params = {'league_id_nullable': league_id, 'season_nullable': season}
+        if season_type is not None:
+            params['season_type_nullable'] = season_type
+        return self._call_nba_api_cached(
+            'LeagueGameFinder', params, season,
+            lambda: leaguegamefinder.LeagueGameFinder(**params).league_game_finder_results.get_data_frame()
+        )
+    
+    def _fetch_league_players(self, league_id, season):
+        """Fetch one season of player bios from LeagueDashPlayerBioStats (runs on a worker thread)"""
+        # Use LeagueDashPlayerBioStats for comprehensive player data
+        params = {'league_id_nullable': league_id, 'season': season}
+        return self._call_nba_api_cached(
+            'LeagueDashPlayerBioStats', params, season,
+            lambda: nbaapi.leaguedashplayerbiostats.LeagueDashPlayerBioStats(
+                **params
+            ).league_dash_player_bio_stats.get_data_frame()
+        )
+    
+    def _add_season_games(self, gamefinder, season, season_type, league_name, last_update_date,
+                          games_collected, season_types_collected):
+        """Apply the incremental-update filter to one season/type of games and keep what's new"""
+        if len(gamefinder) > 0:
+            # Filter by date if doing incremental update
+            if last_update_date:
+                gamefinder = gamefinder.assign(GAME_DATE=pd.to_datetime(gamefinder['GAME_DATE']))
+                gamefinder = gamefinder[gamefinder['GAME_DATE'] > last_update_date]
+            
+            if len(gamefinder) > 0:
+                # Metadata columns are added once, after the concat
+                games_collected.append(gamefinder)
+                season_types_collected.append(season_type)
+                status = f"✓ {len(gamefinder)} games"
+            else:
+                status = "○ No new games"
+        else:
+            status = "○ No games"
+        # One record per season/type instead of a progress line per step
+        logger.info("  %s %s %s: %s", season, league_name, season_type, status,
+                    extra={'event': {'event': 'games_fetched', 'league': league_name, 'season': season,
+                                     'season_type': season_type, 'count': len(gamefinder)}})
+    
     def collect_games_for_league(self, conn, league_config, last_update_date=None, test_mode=False):
         """Collect games for a specific league with incremental update support"""
         league_name = league_config['name']
         league_id = league_config['id']
         
-        print(f"\\n🏀 Collecting {league_name} games...")
+        logger.info("🏀 Collecting %s games...", league_name)
         
         # Generate seasons
         seasons = self.generate_seasons_by_league(league_config)
@@ -345,55 +542,51 @@ class MasterTablesManager:
             seasons = seasons[:2]  # Only recent seasons for testing
             
         games_collected = []
+        season_types_collected = []
         collection_run_id = datetime.now().isoformat()
         
-        for season in seasons:
-            for season_type_config in self.season_types:
-                try:
-                    season_type = season_type_config['type']
-                    combo_name = f"{season} {league_name} {season_type}"
-                    
-                    print(f"  Fetching {combo_name}...", end=" ")
-                    
-                    # Get games from NBA API
-                    gamefinder = leaguegamefinder.LeagueGameFinder(
-                        league_id_nullable=league_id,
-                        season_type_nullable=season_type,
-                        season_nullable=season
-                    ).get_data_frames()[0]
-                    
-                    if len(gamefinder) > 0:
-                        # Filter by date if doing incremental update
-                        if last_update_date:
-                            gamefinder['GAME_DATE'] = pd.to_datetime(gamefinder['GAME_DATE'])
-                            gamefinder = gamefinder[gamefinder['GAME_DATE'] > last_update_date]
-                        
-                        if len(gamefinder) > 0:
-                            # Add metadata
-                            gamefinder['league_name'] = league_name
-                            gamefinder['season_type'] = season_type
-                            gamefinder['collection_run_id'] = collection_run_id
-                            
-                            games_collected.append(gamefinder)
-                            print(f"✓ {len(gamefinder)} games")
-                        else:
-                            print("○ No new games")
-                    else:
-                        print("○ No games")
-                        
-                    time.sleep(0.6)  # Rate limiting
-                    
-                except Exception as e:
-                    print(f"✗ Error: {str(e)}")
-                    time.sleep(2)
+        # One request per season covers every type with a GAME_ID code (split
+        # client-side below), plus one per type that needs its own request.
+        # Each request is independent; map keeps them in order.
+        coded_types = self._coded_season_types
+        tasks = [(season, None) for season in seasons]
+        tasks += [(season, season_type) for season in seasons for season_type in self._separate_season_types]
+        with ThreadPoolExecutor(max_workers=self.api_workers) as executor:
+            results = executor.map(lambda task: self._fetch_league_games(league_id, *task), tasks)
+            
+            for (season, requested_type), (season_games, error) in zip(tasks, results):
+                if error is not None:
+                    failed_types = [requested_type] if requested_type else [t for t, _ in coded_types]
+                    for season_type in failed_types:
+                        logger.warning("  %s %s %s: ✗ Error: %s", season, league_name, season_type, error,
+                                       extra={'event': {'event': 'games_failed', 'league': league_name,
+                                                        'season': season, 'season_type': season_type}})
+                    continue
+                
+                if requested_type is None:
+                    by_code = dict(tuple(season_games.groupby(season_games['GAME_ID'].str[2], sort=False)))
+                    parts = [(season_type, by_code.get(code, season_games.iloc[:0]))
+                             for season_type, code in coded_types]
+                else:
+                    parts = [(requested_type, season_games)]
+                
+                for season_type, gamefinder in parts:
+                    self._add_season_games(gamefinder, season, season_type, league_name,
+                                           last_update_date, games_collected, season_types_collected)
         
         # Combine and return results
         if games_collected:
             all_games = pd.concat(games_collected, ignore_index=True)
-            print(f"✓ Total new {league_name} games: {len(all_games)}")
+            
+            # Add metadata as categoricals: one small code per row instead of a string each
+            lengths = [len(df) for df in games_collected]
+            all_games['league_name'] = _repeat_category([league_name], [len(all_games)])
+            all_games['season_type'] = _repeat_category(season_types_collected, lengths)
+            all_games['collection_run_id'] = _repeat_category([collection_run_id], [len(all_games)])
+            logger.info("✓ Total new %s games: %d", league_name, len(all_games))
             return all_games
         else:
-            print(f"○ No new {league_name} games to collect")
+            logger.info("○ No new %s games to collect", league_name)
             return None
     
     def collect_players_for_league(self, conn, league_config, last_update_date=None, test_mode=False):
@@ -401,7 +594,7 @@ class MasterTablesManager:
         league_name = league_config['name']
         league_id = league_config['id']
         
-        print(f"\\n👥 Collecting {league_name} players...")
+        logger.info("👥 Collecting %s players...", league_name)
         
         # For players, we typically collect by season
         seasons = self.generate_seasons_by_league(league_config)
@@ -409,50 +602,51 @@ class MasterTablesManager:
             seasons = seasons[:2]  # Only recent seasons for testing
             
         players_collected = []
+        seasons_collected = []
         collection_run_id = datetime.now().isoformat()
         
-        for season in seasons:
-            try:
-                print(f"  Fetching {league_name} players for {season}...", end=" ")
-                
-                # Use LeagueDashPlayerBioStats for comprehensive player data
-                player_endpoint = nbaapi.leaguedashplayerbiostats.LeagueDashPlayerBioStats(
-                    league_id_nullable=league_id,
-                    season=season
-                )
-                players_df = player_endpoint.get_data_frames()[0]
+        with ThreadPoolExecutor(max_workers=self.api_workers) as executor:
+            results = executor.map(lambda season: self._fetch_league_players(league_id, season), seasons)
+            
+            for season, (players_df, error) in zip(seasons, results):
+                if error is not None:
+                    logger.warning("  %s players for %s: ✗ Error: %s", league_name, season, error,
+                                   extra={'event': {'event': 'players_failed', 'league': league_name,
+                                                    'season': season}})
+                    continue
                 
+                event = {'event': 'players_fetched', 'league': league_name, 'season': season,
+                         'count': len(players_df)}
                 if len(players_df) > 0:
-                    # Add metadata
-                    players_df['league_name'] = league_name
-                    players_df['season'] = season
-                    players_df['collection_run_id'] = collection_run_id
-                    players_df['last_updated'] = datetime.now()
-                    
+                    # Metadata columns are added once, after the concat
                     players_collected.append(players_df)
-                    print(f"✓ {len(players_df)} players")
+                    seasons_collected.append(season)
+                    logger.info("  %s players for %s: ✓ %d players", league_name, season, len(players_df),
+                                extra={'event': event})
                 else:
-                    print("○ No players")
-                    
-                time.sleep(0.6)
-                
-            except Exception as e:
-                print(f"✗ Error: {str(e)}")
-                time.sleep(2)
+                    logger.info("  %s players for %s: ○ No players", league_name, season,
+                                extra={'event': event})
         
         if players_collected:
             all_players = pd.concat(players_collected, ignore_index=True)
-            print(f"✓ Total {league_name} players: {len(all_players)}")
+            
+            # Add metadata as categoricals; last_updated is a single datetime64 broadcast
+            lengths = [len(df) for df in players_collected]
+            all_players['league_name'] = _repeat_category([league_name], [len(all_players)])
+            all_players['season'] = _repeat_category(seasons_collected, lengths)
+            all_players['collection_run_id'] = _repeat_category([collection_run_id], [len(all_players)])
+            all_players['last_updated'] = datetime.now()
+            logger.info("✓ Total %s players: %d", league_name, len(all_players))
             return all_players
         else:
-            print(f"○ No {league_name} players collected")
+            logger.info("○ No %s players collected", league_name)
             return None
     
     def collect_teams_for_league(self, conn, league_config):
         """Collect teams data (this is simpler since teams don't change often)"""
         league_name = league_config['name']
         
-        print(f"\\n🏟️ Collecting {league_name} teams...")
+        logger.info("🏟️ Collecting %s teams...", league_name)
         
         # Get teams from static data
         teams_data = teams.get_teams()
@@ -463,27 +657,23 @@ class MasterTablesManager:
         teams_df['last_updated'] = datetime.now()
         teams_df['collection_run_id'] = datetime.now().isoformat()
         
-        print(f"✓ {len(teams_df)} teams collected")
+        logger.info("✓ %d teams collected", len(teams_df))
         return teams_df
     
     def upsert_data_to_table(self, conn, df, table_name, table_type):
         """Insert or update data in master table"""
         if df is None or len(df) == 0:
-            print(f"No data to upsert for {table_name}")
+            logger.info("No data to upsert for %s", table_name)
             return 0
             
-        # Clean the dataframe
-        clean_df = self.clean_column_names(df.copy())
-        
         cursor = conn.cursor()
         
         # Get unique columns for conflict resolution
         unique_cols = self.master_tables[table_type]['unique_columns']
         unique_cols_clean = [re.sub(r'[^a-zA-Z0-9]', '', col).lower() for col in unique_cols]
         
-        # Prepare columns and values
-        columns = clean_df.columns.tolist()
-        placeholders = ', '.join(['%s'] * len(columns))
+        # Prepare columns and values (cleaned names only - the frame itself isn't copied)
+        columns = [re.sub(r'[^a-zA-Z0-9]', '', col).lower() for col in df.columns]
         columns_sql = ', '.join(columns)
         
         # Create ON CONFLICT clause for upsert
@@ -492,30 +682,38 @@ class MasterTablesManager:
         
         upsert_query = f"""
             INSERT INTO {table_name} ({columns_sql}) 
-            VALUES ({placeholders})
+            VALUES %s
             ON CONFLICT ({conflict_cols}) 
             DO UPDATE SET {update_set}, updated_at = CURRENT_TIMESTAMP;
         """
         
-        # Convert dataframe to tuples
-        data_tuples = [tuple(row) for row in clean_df.to_numpy()]
+        # A multi-row INSERT can't touch the same key twice, so keep the last
+        # row per key - the same final state the old row-by-row upsert left
+        key_cols = [df.columns[columns.index(col)] for col in unique_cols_clean if col in columns]
+        if key_cols:
+            df = df.drop_duplicates(subset=key_cols, keep='last')
+        
+        # Stream rows to execute_values page by page: one multi-row statement
+        # per UPSERT_PAGE_SIZE rows instead of 100 single-row statements per trip
+        rows = df.itertuples(index=False, name=None)
         
         try:
-            execute_batch(cursor, upsert_query, data_tuples)
+            execute_values(cursor, upsert_query, rows, page_size=UPSERT_PAGE_SIZE)
             conn.commit()
-            print(f"✓ Upserted {len(data_tuples)} records to {table_name}")
-            return len(data_tuples)
+            logger.info("✓ Upserted %d records to %s", len(df), table_name,
+                        extra={'event': {'event': 'upserted', 'table': table_name, 'count': len(df)}})
+            return len(df)
             
         except Exception as e:
             conn.rollback()
-            print(f"✗ Error upserting to {table_name}: {str(e)}")
+            logger.error("✗ Error upserting to %s: %s", table_name, e)
             return 0
     
     def update_master_games(self, test_mode=False):
         """Update all league master games tables"""
-        print("\\n" + "="*60)
-        print("🎯 UPDATING MASTER GAMES TABLES (Daily Process)")
-        print("="*60)
+        logger.info("=" * 60)
+        logger.info("🎯 UPDATING MASTER GAMES TABLES (Daily Process)")
+        logger.info("=" * 60)
         
         conn = self.connect_to_database()
         if not conn:
@@ -524,19 +722,27 @@ class MasterTablesManager:
         total_records = 0
         
         try:
-            for league_config in self.league_configs:
-                league_name = league_config['name']
-                table_name = f"master_games_{league_name.lower()}"
-                
-                print(f"\\n📊 Processing {table_name}...")
-                
-                # Check if table exists and get last update
-                last_update = self.get_last_update_time(conn, table_name, 'games')
-                
-                # Collect games data
-                games_df = self.collect_games_for_league(conn, league_config, last_update, test_mode)
+            # Check if tables exist and get last updates (cheap, and keeps the connection single-threaded)
+            last_updates = [
+                self.get_last_update_time(conn, f"master_games_{league_config['name'].lower()}", 'games')
+                for league_config in self.league_configs
+            ]
+            
+            # Leagues are independent, so their API collection runs side by side;
+            # map yields in league order and writes stay on this thread
+            with ThreadPoolExecutor(max_workers=len(self.league_configs)) as executor:
+                collected = executor.map(
+                    lambda args: self.collect_games_for_league(conn, *args, test_mode),
+                    zip(self.league_configs, last_updates)
+                )
                 
-                if games_df is not None:
+                for league_config, games_df in zip(self.league_configs, collected):
+                    table_name = f"master_games_{league_config['name'].lower()}"
+                    logger.info("📊 Processing %s...", table_name)
+                    
+                    if games_df is None:
+                        continue
+                    
                     # Create table if needed (using first batch as schema sample)
                     self.create_master_table_schema(conn, table_name, games_df, 'games')
                     
@@ -544,11 +750,11 @@ class MasterTablesManager:
                     records_added = self.upsert_data_to_table(conn, games_df, table_name, 'games')
                     total_records += records_added
                 
-            print(f"\\n✅ Games update complete: {total_records} total records processed")
+            logger.info("✅ Games update complete: %d total records processed", total_records)
             return True
             
         except Exception as e:
-            print(f"\\n❌ Games update failed: {str(e)}")
+            logger.error("❌ Games update failed: %s", e)
             return False
         finally:
             if conn:
@@ -556,9 +762,9 @@ class MasterTablesManager:
     
     def update_master_players(self, test_mode=False):
         """Update all league master players tables"""
-        print("\\n" + "="*60)
-        print("👥 UPDATING MASTER PLAYERS TABLES (Weekly Process)")
-        print("="*60)
+        logger.info("=" * 60)
+        logger.info("👥 UPDATING MASTER PLAYERS TABLES (Weekly Process)")
+        logger.info("=" * 60)
         
         conn = self.connect_to_database()
         if not conn:
@@ -567,19 +773,26 @@ class MasterTablesManager:
         total_records = 0
         
         try:
-            for league_config in self.league_configs:
-                league_name = league_config['name']
-                table_name = f"master_players_{league_name.lower()}"
-                
-                print(f"\\n📊 Processing {table_name}...")
-                
-                # Get last update time
-                last_update = self.get_last_update_time(conn, table_name, 'players')
-                
-                # Collect players data
-                players_df = self.collect_players_for_league(conn, league_config, last_update, test_mode)
+            # Get last update times (cheap, and keeps the connection single-threaded)
+            last_updates = [
+                self.get_last_update_time(conn, f"master_players_{league_config['name'].lower()}", 'players')
+                for league_config in self.league_configs
+            ]
+            
+            # Collect every league's players side by side; writes stay on this thread
+            with ThreadPoolExecutor(max_workers=len(self.league_configs)) as executor:
+                collected = executor.map(
+                    lambda args: self.collect_players_for_league(conn, *args, test_mode),
+                    zip(self.league_configs, last_updates)
+                )
                 
-                if players_df is not None:
+                for league_config, players_df in zip(self.league_configs, collected):
+                    table_name = f"master_players_{league_config['name'].lower()}"
+                    logger.info("📊 Processing %s...", table_name)
+                    
+                    if players_df is None:
+                        continue
+                    
                     # Create table if needed
                     self.create_master_table_schema(conn, table_name, players_df, 'players')
                     
@@ -587,11 +800,11 @@ class MasterTablesManager:
                     records_added = self.upsert_data_to_table(conn, players_df, table_name, 'players')
                     total_records += records_added
                 
-            print(f"\\n✅ Players update complete: {total_records} total records processed")
+            logger.info("✅ Players update complete: %d total records processed", total_records)
             return True
             
         except Exception as e:
-            print(f"\\n❌ Players update failed: {str(e)}")
+            logger.error("❌ Players update failed: %s", e)
             return False
         finally:
             if conn:
@@ -599,9 +812,9 @@ class MasterTablesManager:
     
     def update_master_teams(self, test_mode=False):
         """Update all league master teams tables"""
-        print("\\n" + "="*60)
-        print("🏟️ UPDATING MASTER TEAMS TABLES (Yearly Process)")
-        print("="*60)
+        logger.info("=" * 60)
+        logger.info("🏟️ UPDATING MASTER TEAMS TABLES (Yearly Process)")
+        logger.info("=" * 60)
         
         conn = self.connect_to_database()
         if not conn:
@@ -614,7 +827,7 @@ class MasterTablesManager:
                 league_name = league_config['name']
                 table_name = f"master_teams_{league_name.lower()}"
                 
-                print(f"\\n📊 Processing {table_name}...")
+                logger.info("📊 Processing %s...", table_name)
                 
                 # Collect teams data
                 teams_df = self.collect_teams_for_league(conn, league_config)
@@ -627,11 +840,11 @@ class MasterTablesManager:
                     records_added = self.upsert_data_to_table(conn, teams_df, table_name, 'teams')
                     total_records += records_added
                 
-            print(f"\\n✅ Teams update complete: {total_records} total records processed")
+            logger.info("✅ Teams update complete: %d total records processed", total_records)
             return True
             
         except Exception as e:
-            print(f"\\n❌ Teams update failed: {str(e)}")
+            logger.error("❌ Teams update failed: %s", e)
             return False
         finally:
             if conn:
@@ -639,40 +852,48 @@ class MasterTablesManager:
     
     def run_full_backfill(self, test_mode=True):
         """Run complete backfill of all master tables"""
-        print("\\n" + "="*80)
-        print("🚀 RUNNING COMPLETE NBA MASTER TABLES BACKFILL")
-        print("="*80)
+        logger.info("=" * 80)
+        logger.info("🚀 RUNNING COMPLETE NBA MASTER TABLES BACKFILL")
+        logger.info("=" * 80)
         
         start_time = time.time()
         
         if test_mode:
-            print("🧪 TEST MODE: Limited data collection for validation")
+            logger.info("🧪 TEST MODE: Limited data collection for validation")
         else:
-            print("🏭 FULL MODE: Complete historical data collection")
-            print("⚠️  This will take several hours due to API rate limits!")
+            logger.info("🏭 FULL MODE: Complete historical data collection")
+            logger.warning("⚠️  This will take several hours due to API rate limits!")
         
         # Run all updates
-        results = {
-            'teams': self.update_master_teams(test_mode),
-            'players': self.update_master_players(test_mode), 
-            'games': self.update_master_games(test_mode)
-        }
+        # Teams come from nba_api's static data (no API calls, own connection),
+        # so they load while players and games work through the rate limit
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            teams_future = executor.submit(self.update_master_teams, test_mode)
+            players_ok = self.update_master_players(test_mode)
+            # Switching endpoints on a session that has gone stale is where calls start timing out
+            self.reset_api_session()
+            games_ok = self.update_master_games(test_mode)
+            results = {
+                'teams': teams_future.result(),
+                'players': players_ok,
+                'games': games_ok
+            }
         
         # Summary
         elapsed_time = time.time() - start_time
         
-        print("\\n" + "="*80)
-        print("🏁 BACKFILL COMPLETE!")
-        print(f"⏱️ Total time: {elapsed_time/60:.1f} minutes")
+        logger.info("=" * 80)
+        logger.info("🏁 BACKFILL COMPLETE!")
+        logger.info("⏱️ Total time: %.1f minutes", elapsed_time / 60)
         
-        print("\\n📊 RESULTS:")
+        logger.info("📊 RESULTS:")
         for process, success in results.items():
             status = "✅ SUCCESS" if success else "❌ FAILED"
-            print(f"  {process.upper()}: {status}")
+            logger.info("  %s: %s", process.upper(), status)
         
         all_success = all(results.values())
         final_status = "🎉 ALL PROCESSES COMPLETED" if all_success else "⚠️ SOME PROCESSES FAILED"
-        print(f"\\n{final_status}")
+        logger.info(final_status)
         
         return results
     
@@ -691,11 +912,13 @@ class MasterTablesManager:
             
             # Get all master tables
             cursor.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name LIKE 'master_%'
-                ORDER BY table_name;
+                SELECT c.relname 
+                FROM pg_class c 
+                JOIN pg_namespace n ON n.oid = c.relnamespace 
+                WHERE n.nspname = 'public' 
+                AND c.relkind IN ('r', 'p')
+                AND c.relname LIKE 'master_%'
+                ORDER BY c.relname;
             """)
             
             tables = cursor.fetchall()
@@ -706,11 +929,13 @@ class MasterTablesManager:
             
             print(f"Found {len(tables)} master tables:\\n")
             
-            for (table_name,) in tables:
-                # Get row count and last update
-                cursor.execute(f"SELECT COUNT(*), MAX(updated_at) FROM {table_name};")
-                count, last_update = cursor.fetchone()
-                
+            # Row count and last update for every table in one round trip
+            cursor.execute(" UNION ALL ".join(
+                f"SELECT '{table_name}', COUNT(*), MAX(updated_at) FROM {table_name}"
+                for (table_name,) in tables
+            ) + " ORDER BY 1;")
+            
+            for table_name, count, last_update in cursor.fetchall():
                 print(f"📊 {table_name}:")
                 print(f"   Records: {count:,}")
                 print(f"   Last updated: {last_update or 'Never'}")
@@ -724,7 +949,22 @@ class MasterTablesManager:
 
 def main():
     """Main execution with interactive menu"""
-    manager = MasterTablesManager()
+    parser = argparse.ArgumentParser(description='NBA master tables database manager')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always call the NBA API instead of reusing cached season responses')
+    parser.add_argument('--json-logs', action='store_true',
+                        help='Emit collection progress as one JSON object per line (for CI)')
+    args = parser.parse_args()
+    
+    # Collection progress goes through this module's logger; keep it on stdout like
+    # the menu. Importing rds_connection_manager already configured the root logger
+    # (timestamped, stderr + file), so don't propagate there.
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonLogFormatter() if args.json_logs else logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    manager = MasterTablesManager(use_cache=not args.no_cache)
     
     print("🏀 NBA MASTER TABLES DATABASE MANAGER")
     print("="*50)
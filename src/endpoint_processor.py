@@ -5,12 +5,18 @@ Processes one endpoint per job for parallel execution - streamlined version
 """
 
 import argparse
+import functools
 import json
 import logging
 import os
+import queue
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Any, NamedTuple
 
 # Add project paths
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,8 +25,15 @@ sys.path.append(os.path.join(project_root, 'endpoints'))
 sys.path.append(os.path.join(project_root, 'endpoints', 'config'))
 
 import pandas as pd
+from psycopg2.extras import execute_values
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import nba_api.stats.endpoints as nbaapi
+from nba_api.stats.library.http import NBAStatsHTTP
 from rds_connection_manager import RDSConnectionManager
+from api_errors import is_permanent_api_error, is_throttle_error
+from response_cache import load_cached_response, save_cached_response, ttl_for_params
 from config.endpoints_config import get_endpoint_by_name
 from dataframe_name_matcher import match_dataframes_to_names
 from player_dashboard_enhancer import (
@@ -29,6 +42,102 @@ from player_dashboard_enhancer import (
     validate_player_dashboard_data
 )
 
+# Bounded hand-off between the API fetcher and the DB writer thread
+WRITE_QUEUE_MAXSIZE = 8
+_WRITER_STOP = object()  # Sentinel telling the writer thread to exit
+
+# Concurrent API fetchers (--fetch-workers) share one RateLimiter; IDs are
+# handed out in small batches so results reach the writer in order
+FETCH_BATCH_SIZE = 16
+_api_pool_size = 1  # Connection pool size used whenever the API session is rebuilt
+
+# Failed IDs are buffered by the writer and inserted in batches of this size
+FAILED_ID_BATCH_SIZE = 500
+
+# Matched dataframe names per (endpoint class, result-set count). Matching reads
+# the class-level expected_data; data_sets only exist on an instance that fetched.
+_DF_NAMES_CACHE = {}
+
+# Adaptive rate limiting (AIMD): shrink the interval slowly while the API is
+# healthy, double it on throttling. Learned intervals persist between runs.
+RATE_LIMIT_STATE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs', 'rate_limits.json')
+RATE_LIMIT_OK_STREAK = 20        # Successful calls before shrinking the interval
+RATE_LIMIT_DECAY = 0.9           # Multiplicative decrease while healthy
+RATE_LIMIT_MIN_FACTOR = 0.5      # Never go below this fraction of --rate-limit
+RATE_LIMIT_MAX_INTERVAL = 30.0   # Cap on the backed-off interval (seconds)
+
+class RateLimiter:
+    """
+    Adaptive spacing between API calls for one endpoint
+    
+    wait() blocks until current_interval has passed since the previous call.
+    record_success() / record_throttle() adjust the interval AIMD-style.
+    Safe to share between fetcher threads.
+    """
+    
+    def __init__(self, endpoint_name, base_interval, logger, state_file=RATE_LIMIT_STATE_FILE):
+        self.endpoint_name = endpoint_name
+        self.logger = logger
+        self.state_file = state_file
+        self.min_interval = base_interval * RATE_LIMIT_MIN_FACTOR
+        self.max_interval = max(RATE_LIMIT_MAX_INTERVAL, base_interval)
+        self.current_interval = base_interval
+        self.consecutive_ok = 0
+        self.last_call = 0.0
+        self._lock = threading.Lock()
+        
+        # Resume from the interval learned on the previous run, if any
+        try:
+            with open(self.state_file, 'r') as f:
+                saved = json.load(f).get(endpoint_name)
+            if saved is not None:
+                self.current_interval = min(max(float(saved), self.min_interval), self.max_interval)
+                logger.info(f"Resuming rate limit for {endpoint_name} at {self.current_interval:.2f}s")
+        except (OSError, ValueError):
+            pass
+    
+    def wait(self):
+        """Sleep until the current interval has elapsed since the last call"""
+        # Reserve the next slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.last_call + self.current_interval)
+            self.last_call = slot
+        remaining = slot - now
+        if remaining > 0:
+            self.logger.debug("Rate limiting: waiting %.2f seconds...", remaining)
+            time.sleep(remaining)
+    
+    def record_success(self):
+        """Additive-increase side: speed up a little after a streak of clean calls"""
+        with self._lock:
+            self.consecutive_ok += 1
+            if self.consecutive_ok >= RATE_LIMIT_OK_STREAK:
+                self.consecutive_ok = 0
+                self.current_interval = max(self.min_interval, self.current_interval * RATE_LIMIT_DECAY)
+    
+    def record_throttle(self):
+        """Multiplicative backoff on timeouts / HTTP 429"""
+        with self._lock:
+            self.consecutive_ok = 0
+            self.current_interval = min(self.max_interval, max(self.current_interval, 0.1) * 2)
+        self.logger.warning(f"Throttled - rate limit widened to {self.current_interval:.2f}s")
+    
+    def save(self):
+        """Persist the learned interval for this endpoint"""
+        try:
+            try:
+                with open(self.state_file, 'r') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+            state[self.endpoint_name] = round(self.current_interval, 3)
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            with open(self.state_file, 'w') as f:
+                json.dump(state, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not save rate limit state: {e}")
+
 def setup_logging(node_id, log_level='INFO'):
     """Setup logging for this specific node"""
     
@@ -76,6 +185,40 @@ def load_database_config(config_path):
     except Exception as e:
         raise Exception(f"Failed to load database config from {config_path}: {e}")
 
+def _read_existing_ids(cursor, endpoint_tables, id_column, logger):
+    """
+    IDs already stored in any of endpoint_tables
+    
+    Tries one UNION over every table first. If that fails (e.g. the ID column
+    is text in one table and bigint in another), falls back to one query per
+    table so a single bad table can't make the whole endpoint look complete.
+    Savepoints keep a failed query from aborting the surrounding transaction.
+    """
+    cursor.execute("SAVEPOINT existing_ids")
+    try:
+        cursor.execute(" UNION ".join(
+            f"SELECT {id_column} FROM {table}" for table in endpoint_tables
+        ))
+        existing_ids = set(row[0] for row in cursor.fetchall())
+        cursor.execute("RELEASE SAVEPOINT existing_ids")
+        return existing_ids
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT existing_ids")
+        logger.warning(f"Combined ID query over {len(endpoint_tables)} tables failed, "
+                       f"reading them one by one: {e}")
+    
+    # The savepoint survives ROLLBACK TO, so each table can fail on its own
+    existing_ids = set()
+    for table in endpoint_tables:
+        try:
+            cursor.execute(f"SELECT DISTINCT {id_column} FROM {table}")
+            existing_ids.update(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT existing_ids")
+            logger.error(f"Could not read existing IDs from {table}: {e}")
+    cursor.execute("RELEASE SAVEPOINT existing_ids")
+    return existing_ids
+
 def find_missing_ids(conn_manager, master_table, endpoint_table_prefix, id_column, failed_ids_table, logger):
     """
     Find IDs from master table that aren't in endpoint tables and haven't failed before
@@ -126,24 +269,23 @@ def find_missing_ids(conn_manager, master_table, endpoint_table_prefix, id_colum
             # Get existing IDs from endpoint tables
             existing_ids = set()
             
-            # Find endpoint tables with this prefix
+            # Endpoint tables with this prefix that carry the ID column, in one catalog lookup
             cursor.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name LIKE %s
-            """, (f"{endpoint_table_prefix}%",))
+                SELECT c.relname 
+                FROM pg_class c 
+                JOIN pg_namespace n ON n.oid = c.relnamespace 
+                JOIN pg_attribute a ON a.attrelid = c.oid 
+                WHERE n.nspname = 'public' 
+                AND c.relkind IN ('r', 'p')
+                AND c.relname LIKE %s
+                AND a.attname = %s
+                AND NOT a.attisdropped
+            """, (f"{endpoint_table_prefix}%", id_column))
             
             endpoint_tables = [row[0] for row in cursor.fetchall()]
             
-            for table in endpoint_tables:
-                try:
-                    cursor.execute(f"SELECT DISTINCT {id_column} FROM {table}")
-                    table_ids = set(row[0] for row in cursor.fetchall())
-                    existing_ids.update(table_ids)
-                except Exception as e:
-                    logger.debug(f"Could not check {table}: {e}")
-                    continue
+            if endpoint_tables:
+                existing_ids = _read_existing_ids(cursor, endpoint_tables, id_column, logger)
             
             # Get failed IDs to exclude
             failed_ids = set()
@@ -185,39 +327,60 @@ def find_missing_ids(conn_manager, master_table, endpoint_table_prefix, id_colum
         logger.error(f"Error finding missing IDs: {e}")
         return []
 
-def record_failed_id(conn_manager, failed_ids_table, endpoint_prefix, id_column, id_value, error_message, logger):
-    """Record an ID that failed to process to prevent future attempts"""
+def ensure_failed_ids_table(conn_manager, failed_ids_table):
+    """Create failed IDs table if it doesn't exist"""
+    with conn_manager.get_cursor() as cursor:
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {failed_ids_table} (
+                id SERIAL PRIMARY KEY,
+                endpoint_prefix VARCHAR(255) NOT NULL,
+                id_column VARCHAR(50) NOT NULL,
+                id_value VARCHAR(255) NOT NULL,
+                error_message TEXT,
+                failed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(endpoint_prefix, id_column, id_value)
+            )
+        """)
+
+def flush_failed_ids(conn_manager, failed_ids_table, failed_buffer, logger):
+    """
+    Write buffered failures in one round trip and clear the buffer
+    
+    Args:
+        failed_buffer: List of (endpoint_prefix, id_column, id_value, error_message) tuples
+    """
+    if not failed_buffer:
+        return
+    
+    # ON CONFLICT DO UPDATE can't touch the same row twice in one statement - keep the latest
+    rows = {}
+    for endpoint_prefix, id_column, id_value, error_message in failed_buffer:
+        rows[(endpoint_prefix, id_column, str(id_value))] = str(error_message)[:500]
+    
     try:
-        # Create failed IDs table if it doesn't exist
+        ensure_failed_ids_table(conn_manager, failed_ids_table)
         with conn_manager.get_cursor() as cursor:
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {failed_ids_table} (
-                    id SERIAL PRIMARY KEY,
-                    endpoint_prefix VARCHAR(255) NOT NULL,
-                    id_column VARCHAR(50) NOT NULL,
-                    id_value VARCHAR(255) NOT NULL,
-                    error_message TEXT,
-                    failed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(endpoint_prefix, id_column, id_value)
-                )
-            """)
-            
-            # Insert failed ID
-            cursor.execute(f"""
+            execute_values(cursor, f"""
                 INSERT INTO {failed_ids_table} 
                 (endpoint_prefix, id_column, id_value, error_message)
-                VALUES (%s, %s, %s, %s)
+                VALUES %s
                 ON CONFLICT (endpoint_prefix, id_column, id_value) 
                 DO UPDATE SET 
                     error_message = EXCLUDED.error_message,
                     failed_at = CURRENT_TIMESTAMP
-            """, (endpoint_prefix, id_column, id_value, str(error_message)[:500]))
-            
-        conn_manager.connection.commit()
-        logger.warning(f"Recorded failed ID: {id_value} for {endpoint_prefix}")
+            """, [key + (message,) for key, message in rows.items()], page_size=FAILED_ID_BATCH_SIZE)
+        
+        logger.warning(f"Recorded {len(rows)} failed IDs in {failed_ids_table}")
         
     except Exception as e:
-        logger.error(f"Could not record failed ID: {e}")
+        logger.error(f"Could not record {len(rows)} failed IDs: {e}")
+    
+    failed_buffer.clear()
+
+def record_failed_id(conn_manager, failed_ids_table, endpoint_prefix, id_column, id_value, error_message, logger):
+    """Record an ID that failed to process to prevent future attempts"""
+    flush_failed_ids(conn_manager, failed_ids_table,
+                     [(endpoint_prefix, id_column, id_value, error_message)], logger)
 
 def resolve_parameters_comprehensive(endpoint_name, endpoint_config, conn_manager, logger):
     """
@@ -235,9 +398,9 @@ def resolve_parameters_comprehensive(endpoint_name, endpoint_config, conn_manage
             # For NBA, use current season logic
             current_year = datetime.now().year
             if datetime.now().month >= 10:  # Season starts in fall
-                season = f"{current_year}-{str(current_year + 1)[-2:]}"
+                season = f"{current_year}-{(current_year + 1) % 100:02d}"
             else:
-                season = f"{current_year - 1}-{str(current_year)[-2:]}"
+                season = f"{current_year - 1}-{current_year % 100:02d}"
             resolved_params[param_key] = season
             logger.info(f"Resolved {param_key} = {season}")
             
@@ -410,9 +573,9 @@ def resolve_parameters_comprehensive(endpoint_name, endpoint_config, conn_manage
                     elif param_key == 'season':
                         current_year = datetime.now().year
                         if datetime.now().month >= 10:
-                            season = f"{current_year}-{str(current_year + 1)[-2:]}"
+                            season = f"{current_year}-{(current_year + 1) % 100:02d}"
                         else:
-                            season = f"{current_year - 1}-{str(current_year)[-2:]}"
+                            season = f"{current_year - 1}-{current_year % 100:02d}"
                         resolved_params[param_key] = season
                     
             except Exception as e:
@@ -476,13 +639,51 @@ def resolve_parameters_comprehensive(endpoint_name, endpoint_config, conn_manage
     
     return resolved_params
 
-def make_api_call(endpoint_class, params, rate_limit, logger):
+def _raise_for_throttle(response, *args, **kwargs):
+    """Surface 429s as HTTPError; nba_api would otherwise try to parse the body"""
+    if response.status_code == 429:
+        response.raise_for_status()
+
+def build_api_session(pool_size=1):
+    """
+    Keep-alive session for stats.nba.com with transport-level retries
+    
+    Only connection errors and 5xx are retried here. 429s are left to
+    make_api_call so the adaptive RateLimiter sees them and backs off.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=1.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=frozenset(['GET'])
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.hooks['response'].append(_raise_for_throttle)
+    return session
+
+def reset_api_session(logger, pool_size=None):
+    """
+    Install a fresh pooled session on nba_api (drops stale connections/headers)
+    
+    Args:
+        pool_size: Connections to keep open (one per fetch worker); None keeps the last size
+    """
+    global _api_pool_size
+    if pool_size is not None:
+        _api_pool_size = pool_size
+    NBAStatsHTTP.set_session(build_api_session(_api_pool_size))
+    logger.info("Installed fresh pooled HTTP session for nba_api")
+
+def make_api_call(endpoint_class, params, limiter, logger):
     """Make NBA API call with intelligent retry logic"""
     max_retries = 3
     
     for attempt in range(max_retries):
         try:
-            logger.info(f"Making API call (attempt {attempt + 1}/{max_retries}) with params: {params}")
+            logger.info("Making API call (attempt %d/%d) with params: %s", attempt + 1, max_retries, params)
             endpoint_instance = endpoint_class(**params)
             dataframes = endpoint_instance.get_data_frames()
             
@@ -490,42 +691,29 @@ def make_api_call(endpoint_class, params, rate_limit, logger):
                 logger.warning("API returned None - no data available for these parameters")
                 return None
                 
-            logger.info(f"API call successful - got {len(dataframes)} dataframes")
+            logger.info("API call successful - got %d dataframes", len(dataframes))
+            limiter.record_success()
             return dataframes
             
         except Exception as e:
-            error_str = str(e).lower()
-            logger.warning(f"API call failed (attempt {attempt + 1}): {str(e)}")
+            logger.warning("API call failed (attempt %d): %s", attempt + 1, e)
             
-            # Don't retry for parameter errors, authentication issues, or permanent failures
-            permanent_error_indicators = [
-                'invalid game id',
-                'invalid player id', 
-                'invalid team id',
-                'bad request',
-                '400',
-                '401', 
-                '403',
-                'unauthorized',
-                'forbidden',
-                'parameter',
-                'invalid parameter',
-                'missing required',
-                'missing 1 required positional argument',
-                'nonetype',  # API returning None due to bad parameters
-                'keys',      # 'NoneType' object has no attribute 'keys'
-                'list index out of range',  # Empty response causing list access errors
-                'expecting value',  # Empty body — stat type doesn't exist for this game/era
-            ]
+            # A timed-out connection tends to poison the pooled session - start clean
+            if isinstance(e, requests.exceptions.Timeout):
+                reset_api_session(logger)
             
-            if any(indicator in error_str for indicator in permanent_error_indicators):
+            if is_throttle_error(e):
+                limiter.record_throttle()
+            
+            # Don't retry for parameter errors, authentication issues, or permanent failures
+            if is_permanent_api_error(e):
                 logger.error(f"Permanent error detected, not retrying: {str(e)}")
                 return "PERMANENT_ERROR"
             
             # Retry for temporary errors (network, rate limiting, server issues)
             if attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 2
-                logger.info(f"Temporary error, retrying in {wait_time} seconds...")
+                logger.info("Temporary error, retrying in %s seconds...", wait_time)
                 time.sleep(wait_time)
             else:
                 logger.error(f"All API call attempts failed: {str(e)}")
@@ -533,7 +721,275 @@ def make_api_call(endpoint_class, params, rate_limit, logger):
     
     return None
 
-def process_single_endpoint_comprehensive(endpoint_name, node_id, rate_limit, logger):
+def build_static_params(endpoint_config, main_param_key):
+    """
+    Resolve the config parameters that stay the same for every missing ID
+    
+    Runs once per endpoint; the per-ID loop only merges in the varying key(s).
+    
+    Returns:
+        dict: Static parameter values keyed by API parameter name
+    """
+    static_params = {}
+    current_season = get_current_season()
+    
+    for param_key_static, param_source_static in endpoint_config.get('parameters', {}).items():
+        if main_param_key == 'player_season_combinations':
+            # Handle static values that aren't player_id or season
+            if param_key_static in ['player_id', 'season']:
+                continue
+            if isinstance(param_source_static, str) and param_source_static not in ['from_masterplayers_all_seasons']:
+                static_params[param_key_static] = param_source_static
+            elif isinstance(param_source_static, (int, float, bool)):
+                static_params[param_key_static] = param_source_static
+            continue
+        
+        if param_key_static == main_param_key:  # Don't override our main parameter
+            continue
+        
+        # Handle direct string values
+        if isinstance(param_source_static, str):
+            if param_source_static in ['from_current_season', 'from_recent_season']:
+                static_params[param_key_static] = current_season
+            elif param_source_static not in ['from_mastergames', 'from_masterplayers', 'from_masterteams']:
+                # It's a static value
+                static_params[param_key_static] = param_source_static
+        elif isinstance(param_source_static, (int, float, bool)):
+            # Handle numeric and boolean static values (like last_n_games: 30)
+            static_params[param_key_static] = param_source_static
+        else:
+            # Handle object format
+            try:
+                source_type = param_source_static.get('source', 'static')
+                if source_type == 'static':
+                    static_params[param_key_static] = param_source_static.get('value')
+                elif source_type in ['from_current_season', 'from_recent_season']:
+                    static_params[param_key_static] = current_season
+            except AttributeError:
+                # If it's not a dict-like object, treat as static value
+                static_params[param_key_static] = param_source_static
+    
+    return static_params
+
+class IdContext(NamedTuple):
+    """Per-ID state built once by _fetch_one and handed to the writer"""
+    params: dict
+    identifier: str   # Human-readable label for log messages
+    record_key: Any   # Value stored in the failed IDs table
+
+def _id_context(main_param_key, missing_id, static_params):
+    """Build the API parameters and labels for one missing ID"""
+    if main_param_key == 'player_season_combinations':
+        player_id, season = missing_id  # Unpack the tuple
+        return IdContext({'player_id': player_id, 'season': season, **static_params},
+                         f"Player {player_id}, Season {season}",
+                         f"{player_id}_{season}")  # Use combined key for database
+    return IdContext({main_param_key: missing_id, **static_params},
+                     f"{main_param_key}={missing_id}",
+                     missing_id)
+
+def _fetch_one(endpoint_name, endpoint_class, static_params, main_param_key, missing_id,
+               index, total, limiter, logger):
+    """
+    Build parameters for one missing ID, validate them and call the API
+    
+    Returns:
+        tuple: (IdContext, dataframes, failure_reason)
+               failure_reason is None when the dataframes should be persisted
+    """
+    ctx = _id_context(main_param_key, missing_id, static_params)
+    logger.info("\\n--- Processing %d/%d: %s ---", index + 1, total, ctx.identifier)
+    logger.info("Parameters for this call: %s", ctx.params)
+    
+    # Validate parameters before making API call
+    is_valid, validation_error = validate_api_parameters(endpoint_name, ctx.params, logger)
+    if not is_valid:
+        logger.error(f"Parameter validation failed for {ctx.identifier}: {validation_error}")
+        return ctx, None, f"Parameter validation failed: {validation_error}"
+    
+    # Reuse a response fetched by an earlier run if we still have it
+    cache_ttl = ttl_for_params(ctx.params, get_current_season())
+    dataframes = load_cached_response(endpoint_name, ctx.params, cache_ttl, logger)
+    if dataframes is not None:
+        logger.info("Using cached API response for %s", ctx.identifier)
+        return ctx, dataframes, None
+    
+    # Make API call for this specific ID
+    try:
+        limiter.wait()
+        dataframes = make_api_call(endpoint_class, ctx.params, limiter, logger)
+    except Exception as e:
+        logger.error(f"API call failed for {ctx.identifier}: {str(e)}")
+        return ctx, None, str(e)
+    
+    if dataframes == "PERMANENT_ERROR":
+        logger.error(f"Permanent API error for {ctx.identifier} - recording as failed")
+        return ctx, None, "Permanent API parameter error"
+    
+    if dataframes is None:
+        logger.warning(f"No data returned for {ctx.identifier}")
+        return ctx, None, "No data returned"
+    
+    if not isinstance(dataframes, list) or len(dataframes) == 0:
+        logger.warning(f"Empty or invalid dataframes for {ctx.identifier}")
+        return ctx, None, "Empty dataframes returned"
+    
+    save_cached_response(endpoint_name, ctx.params, dataframes, logger)
+    return ctx, dataframes, None
+
+def _persist_one(conn_manager, endpoint_name, endpoint_class, current_params, dataframes,
+                 known_tables, table_prefix, is_player_dash, logger):
+    """
+    Clean and insert the dataframes returned for one missing ID
+    
+    known_tables holds the tables already ensured during this run; each new
+    table gets one idempotent CREATE TABLE IF NOT EXISTS, later IDs skip it.
+    
+    Returns:
+        int: Number of dataframes stored successfully
+    """
+    success_count = 0
+    error_count = 0
+    
+    # Use advanced dataframe name matching instead of unreliable dictionary order.
+    # Responses with the same number of result sets share a match, so reuse it.
+    names_key = (endpoint_class, len(dataframes))
+    dataframe_names = _DF_NAMES_CACHE.get(names_key)
+    if dataframe_names is None:
+        try:
+            # expected_data is class-level, so no instance (or HTTP call) is needed
+            dataframe_names = match_dataframes_to_names(dataframes, endpoint_class, logger)
+            _DF_NAMES_CACHE[names_key] = dataframe_names
+            logger.info("Matched dataframe names: %s", dataframe_names)
+            
+        except Exception as e:
+            logger.warning(f"Could not match dataframe names, using fallback: {e}")
+            # Fallback to simple index-based naming
+            dataframe_names = [f"dataframe_{i}" for i in range(len(dataframes))]
+    
+    # Player context used by both the enhancement and the per-dataframe validation
+    player_id = current_params.get('player_id')
+    season = current_params.get('season', 'unknown')
+    
+    # SPECIAL HANDLING: Player Dashboard Enhancement
+    if is_player_dash:
+        logger.info(f"PLAYER DASHBOARD: Player Dashboard endpoint detected - adding player context")
+        
+        if player_id:
+            # Enhance dataframes with player_id and season columns
+            dataframes = enhance_player_dashboard_dataframes(
+                dataframes=dataframes,
+                player_id=player_id,
+                season=season,
+                endpoint_name=endpoint_name,
+                logger=logger
+            )
+            logger.info(f"SUCCESS: Enhanced {len(dataframes)} dataframes with player context")
+        else:
+            logger.warning("WARNING: Player dashboard endpoint but no player_id found in parameters!")
+    
+    # Drop None/empty results up front (most multi-result endpoints return several);
+    # anything without an .empty attribute isn't a dataframe and is skipped as well
+    valid_dataframes = [(df_index, df) for df_index, df in enumerate(dataframes)
+                        if df is not None and not getattr(df, 'empty', True)]
+    if len(valid_dataframes) < len(dataframes):
+        skipped = sorted(set(range(len(dataframes))) - {df_index for df_index, _ in valid_dataframes})
+        logger.warning(f"  Dataframes {skipped} are None or empty, skipping")
+    
+    for df_index, df in valid_dataframes:
+        try:
+            # Use matched dataframe name (should always be available now)
+            if df_index < len(dataframe_names):
+                df_name = dataframe_names[df_index]
+                table_name = f"{table_prefix}_{df_name}"
+                logger.info("  Processing dataframe %d (%s) -> %s", df_index, df_name, table_name)
+            else:
+                # Extra safety fallback (shouldn't happen with our new matching)
+                table_name = f"{table_prefix}_dataframe_{df_index}"
+                logger.warning(f"  Unexpected: dataframe {df_index} has no matched name, using fallback -> {table_name}")
+            
+            logger.info("    Shape: %s", getattr(df, 'shape', 'unknown'))
+            
+            # VALIDATION: For player dashboard endpoints, validate enhanced data
+            if is_player_dash:
+                if not validate_player_dashboard_data(df, player_id, season, logger):
+                    logger.error(f"Player dashboard data validation failed for dataframe {df_index}")
+                    error_count += 1
+                    continue
+                
+                logger.info(f"SUCCESS: Player dashboard data validation passed")
+            
+            # Clean dataframe in place (handles reserved keywords) - the API
+            # result isn't reused, so there's no need to copy its data
+            cleaned_df = conn_manager.clean_column_names_inplace(df)
+            
+            # Ensure the table once per run - a no-op if another node already made it
+            if table_name not in known_tables:
+                logger.info("Ensuring table: %s", table_name)
+                conn_manager.create_table(table_name, cleaned_df)
+                known_tables.add(table_name)
+            
+            # Insert data
+            logger.info("Inserting %d rows into %s", len(cleaned_df), table_name)
+            conn_manager.copy_dataframe_to_rds(cleaned_df, table_name)
+            logger.info("Successfully inserted data into %s", table_name)
+            success_count += 1
+            
+        except Exception as e:
+            error_count += 1
+            logger.error(f"Failed to process dataframe {df_index}: {str(e)}")
+            continue
+    
+    return success_count
+
+def _drain_write_queue(write_queue, conn_manager, endpoint_name, endpoint_class,
+                       main_param_key, failed_ids_table, known_tables, table_prefix,
+                       is_player_dash, logger):
+    """
+    Writer thread: persist fetched dataframes and record failures in fetch order
+    
+    Returns:
+        tuple: (processed_count, failed_count)
+    """
+    processed = 0
+    failed = 0
+    failed_buffer = []
+    
+    try:
+        while True:
+            item = write_queue.get()
+            if item is _WRITER_STOP:
+                return processed, failed
+            
+            ctx, dataframes, failure_reason = item
+            try:
+                if failure_reason is None:
+                    try:
+                        success_count = _persist_one(conn_manager, endpoint_name, endpoint_class,
+                                                     ctx.params, dataframes, known_tables,
+                                                     table_prefix, is_player_dash, logger)
+                        if success_count > 0:
+                            processed += 1
+                            logger.info("Successfully processed %s (%d dataframes)", ctx.identifier, success_count)
+                            continue
+                        failure_reason = "All dataframes failed to process"
+                        logger.error(f"All dataframes failed for {ctx.identifier}")
+                    except Exception as e:
+                        failure_reason = str(e)
+                        logger.error(f"API call failed for {ctx.identifier}: {failure_reason}")
+                
+                failed += 1
+                failed_buffer.append((table_prefix, main_param_key, ctx.record_key, failure_reason))
+                if len(failed_buffer) >= FAILED_ID_BATCH_SIZE:
+                    flush_failed_ids(conn_manager, failed_ids_table, failed_buffer, logger)
+            except Exception as e:
+                # Never let the writer die - the fetcher would block on a full queue
+                logger.error(f"Writer failed on {ctx.identifier}: {e}")
+    finally:
+        # Whatever is still buffered goes out before the connection is closed
+        flush_failed_ids(conn_manager, failed_ids_table, failed_buffer, logger)
+
+def process_single_endpoint_comprehensive(endpoint_name, node_id, rate_limit, logger, fetch_workers=1):
     """Process a single NBA endpoint comprehensively - collect all missing data"""
     
     logger.info(f"Starting COMPREHENSIVE processing of endpoint: {endpoint_name}")
@@ -561,10 +1017,20 @@ def process_single_endpoint_comprehensive(endpoint_name, node_id, rate_limit, lo
         
         logger.info("Database connection established successfully")
         
+        # One pooled keep-alive session for every API call in this run
+        reset_api_session(logger, pool_size=fetch_workers)
+        
+        # Tables already ensured this run (create_table is idempotent, so no lookup needed)
+        known_tables = set()
+        
         # Get endpoint class
         endpoint_class = getattr(nbaapi, endpoint_name)
         logger.info(f"Got endpoint class: {endpoint_class}")
         
+        # Loop-invariant per endpoint: table/failure prefix and dashboard handling
+        table_prefix = f"nba_{endpoint_name.lower()}"
+        is_player_dash = is_player_dashboard_endpoint(endpoint_name)
+        
         # Find all missing IDs that need to be processed
         missing_ids_by_param = find_all_missing_ids(endpoint_config, conn_manager, logger)
         
@@ -610,267 +1076,47 @@ def process_single_endpoint_comprehensive(endpoint_name, node_id, rate_limit, lo
             logger.info(f"PROCESSING STRATEGY: Comprehensive player-season data collection")
             logger.info(f"DATA SCOPE: This will build complete historical player dashboard datasets")
         
-        # Process each missing ID (or player-season combination)
-        for i, missing_id in enumerate(main_ids):
-            if main_param_key == 'player_season_combinations':
-                # Handle player-season combinations specially
-                player_id, season = missing_id  # Unpack the tuple
-                logger.info(f"\\n--- Processing Player-Season {i+1}/{len(main_ids)}: Player {player_id}, Season {season} ---")
-                
-                # Build parameters for this player-season combination
-                current_params = {
-                    'player_id': player_id,
-                    'season': season
-                }
-                
-                # Add any additional static parameters from config
-                for param_key_static, param_source_static in endpoint_config.get('parameters', {}).items():
-                    if param_key_static not in ['player_id', 'season']:
-                        # Handle static values that aren't player_id or season
-                        if isinstance(param_source_static, str) and param_source_static not in ['from_masterplayers_all_seasons']:
-                            current_params[param_key_static] = param_source_static
-                        elif isinstance(param_source_static, (int, float, bool)):
-                            current_params[param_key_static] = param_source_static
-                
-            else:
-                # Standard single-parameter processing
-                logger.info(f"\\n--- Processing ID {i+1}/{len(main_ids)}: {missing_id} ---")
-                
-                # Build parameters for this specific ID
-                current_params = {}
-                
-                # Add the main ID we're iterating through
-                current_params[main_param_key] = missing_id
-                
-                # Add any static parameters from config
-                for param_key_static, param_source_static in endpoint_config.get('parameters', {}).items():
-                    if param_key_static != main_param_key:  # Don't override our main parameter
-                        # Handle direct string values
-                        if isinstance(param_source_static, str):
-                            if param_source_static in ['from_current_season', 'from_recent_season']:
-                                current_params[param_key_static] = get_current_season()
-                            elif param_source_static not in ['from_mastergames', 'from_masterplayers', 'from_masterteams']:
-                                # It's a static value
-                                current_params[param_key_static] = param_source_static
-                    elif isinstance(param_source_static, (int, float, bool)):
-                        # Handle numeric and boolean static values (like last_n_games: 30)
-                        current_params[param_key_static] = param_source_static
-                    else:
-                        # Handle object format
-                        try:
-                            source_type = param_source_static.get('source', 'static')
-                            if source_type == 'static':
-                                current_params[param_key_static] = param_source_static.get('value')
-                            elif source_type in ['from_current_season', 'from_recent_season']:
-                                current_params[param_key_static] = get_current_season()
-                        except AttributeError:
-                            # If it's not a dict-like object, treat as static value
-                            current_params[param_key_static] = param_source_static
+        # Process each missing ID (or player-season combination).
+        # fetch_workers threads call the API (spaced by the shared limiter) while a
+        # single writer thread drains a bounded queue into the database, so network
+        # and DB latency overlap.
+        write_queue = queue.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+        limiter = RateLimiter(endpoint_name, rate_limit, logger)
+        static_params = build_static_params(endpoint_config, main_param_key)
+        with ThreadPoolExecutor(max_workers=1) as writer_pool:
+            writer = writer_pool.submit(
+                _drain_write_queue, write_queue, conn_manager, endpoint_name,
+                endpoint_class, main_param_key, failed_ids_table, known_tables,
+                table_prefix, is_player_dash, logger
+            )
             
-            logger.info(f"Parameters for this call: {current_params}")
+            # Malformed IDs go straight to the failed list instead of through the fetch loop
+            fetch_ids, invalid_ids = split_valid_main_ids(main_param_key, main_ids)
+            if invalid_ids:
+                logger.warning(f"Skipping {len(invalid_ids)} IDs with an invalid format")
             
-            # Validate parameters before making API call
-            is_valid, validation_error = validate_api_parameters(endpoint_name, current_params, logger)
-            if not is_valid:
-                # Create appropriate validation error identifier
-                if main_param_key == 'player_season_combinations':
-                    validation_identifier = f"Player {player_id}, Season {season}"
-                    record_key_value = f"{player_id}_{season}"
-                else:
-                    validation_identifier = f"{main_param_key}={missing_id}"
-                    record_key_value = missing_id
-                
-                logger.error(f"Parameter validation failed for {validation_identifier}: {validation_error}")
-                record_failed_id(conn_manager, failed_ids_table, f"nba_{endpoint_name.lower()}", 
-                                main_param_key, record_key_value, f"Parameter validation failed: {validation_error}", logger)
-                total_failed += 1
-                continue
+            def fetch(i):
+                return _fetch_one(endpoint_name, endpoint_class, static_params,
+                                  main_param_key, fetch_ids[i], i, len(fetch_ids),
+                                  limiter, logger)
             
-            # Make API call for this specific ID
             try:
-                dataframes = make_api_call(endpoint_class, current_params, rate_limit, logger)
-                
-                if dataframes == "PERMANENT_ERROR":
-                    # Create appropriate permanent error identifier
-                    if main_param_key == 'player_season_combinations':
-                        perm_error_identifier = f"Player {player_id}, Season {season}"
-                        record_key_value = f"{player_id}_{season}"
-                    else:
-                        perm_error_identifier = f"{main_param_key}={missing_id}"
-                        record_key_value = missing_id
-                    
-                    logger.error(f"Permanent API error for {perm_error_identifier} - recording as failed")
-                    record_failed_id(conn_manager, failed_ids_table, f"nba_{endpoint_name.lower()}", 
-                                    main_param_key, record_key_value, "Permanent API parameter error", logger)
-                    total_failed += 1
-                    continue
-                
-                if dataframes is None:
-                    # Create appropriate no data identifier
-                    if main_param_key == 'player_season_combinations':
-                        no_data_identifier = f"Player {player_id}, Season {season}"
-                        record_key_value = f"{player_id}_{season}"
-                    else:
-                        no_data_identifier = f"{main_param_key}={missing_id}"
-                        record_key_value = missing_id
-                    
-                    logger.warning(f"No data returned for {no_data_identifier}")
-                    record_failed_id(conn_manager, failed_ids_table, f"nba_{endpoint_name.lower()}", 
-                                    main_param_key, record_key_value, "No data returned", logger)
-                    total_failed += 1
-                    continue
-                
-                if not isinstance(dataframes, list) or len(dataframes) == 0:
-                    # Create appropriate empty dataframes identifier
-                    if main_param_key == 'player_season_combinations':
-                        empty_identifier = f"Player {player_id}, Season {season}"
-                        record_key_value = f"{player_id}_{season}"
-                    else:
-                        empty_identifier = f"{main_param_key}={missing_id}"
-                        record_key_value = missing_id
-                    
-                    logger.warning(f"Empty or invalid dataframes for {empty_identifier}")
-                    record_failed_id(conn_manager, failed_ids_table, f"nba_{endpoint_name.lower()}", 
-                                    main_param_key, record_key_value, "Empty dataframes returned", logger)
-                    total_failed += 1
-                    continue
-                
-                # Process and store the dataframes
-                success_count = 0
-                error_count = 0
-                
-                # Use advanced dataframe name matching instead of unreliable dictionary order
-                try:
-                    # Create endpoint instance to get dataframe metadata
-                    temp_endpoint_instance = endpoint_class(**current_params)
-                    
-                    # Use our robust matching function to get correct names
-                    dataframe_names = match_dataframes_to_names(dataframes, temp_endpoint_instance, logger)
-                    logger.info(f"Matched dataframe names: {dataframe_names}")
-                    
-                except Exception as e:
-                    logger.warning(f"Could not match dataframe names, using fallback: {e}")
-                    # Fallback to simple index-based naming
-                    dataframe_names = [f"dataframe_{i}" for i in range(len(dataframes))]
-                
-                # SPECIAL HANDLING: Player Dashboard Enhancement
-                if is_player_dashboard_endpoint(endpoint_name):
-                    logger.info(f"PLAYER DASHBOARD: Player Dashboard endpoint detected - adding player context")
-                    
-                    # Extract player_id and season from current_params
-                    player_id = current_params.get('player_id')
-                    season = current_params.get('season', 'unknown')
-                    
-                    if player_id:
-                        # Enhance dataframes with player_id and season columns
-                        dataframes = enhance_player_dashboard_dataframes(
-                            dataframes=dataframes,
-                            player_id=player_id,
-                            season=season,
-                            endpoint_name=endpoint_name,
-                            logger=logger
-                        )
-                        logger.info(f"SUCCESS: Enhanced {len(dataframes)} dataframes with player context")
-                    else:
-                        logger.warning("WARNING: Player dashboard endpoint but no player_id found in parameters!")
-                
-                for df_index, df in enumerate(dataframes):
-                    try:
-                        # Check if dataframe is valid
-                        if df is None or (hasattr(df, 'empty') and df.empty):
-                            logger.warning(f"  Dataframe {df_index} is None or empty, skipping")
-                            continue
-                        
-                        # Use matched dataframe name (should always be available now)
-                        if df_index < len(dataframe_names):
-                            df_name = dataframe_names[df_index]
-                            table_name = f"nba_{endpoint_name.lower()}_{df_name}"
-                            logger.info(f"  Processing dataframe {df_index} ({df_name}) -> {table_name}")
-                        else:
-                            # Extra safety fallback (shouldn't happen with our new matching)
-                            table_name = f"nba_{endpoint_name.lower()}_dataframe_{df_index}"
-                            logger.warning(f"  Unexpected: dataframe {df_index} has no matched name, using fallback -> {table_name}")
-                        
-                        logger.info(f"    Shape: {getattr(df, 'shape', 'unknown')}")
-                        
-                        # VALIDATION: For player dashboard endpoints, validate enhanced data
-                        if is_player_dashboard_endpoint(endpoint_name):
-                            player_id = current_params.get('player_id')
-                            season = current_params.get('season', 'unknown')
-                            
-                            if not validate_player_dashboard_data(df, player_id, season, logger):
-                                logger.error(f"Player dashboard data validation failed for dataframe {df_index}")
-                                error_count += 1
-                                continue
-                            
-                            logger.info(f"SUCCESS: Player dashboard data validation passed")
-                        
-                        # Clean dataframe (handles reserved keywords)
-                        cleaned_df = conn_manager.clean_column_names(df.copy())
-                        
-                        # Check if table exists, create if not
-                        table_exists = conn_manager.check_table_exists(table_name)
-                        if not table_exists:
-                            logger.info(f"Creating table: {table_name}")
-                            conn_manager.create_table(table_name, cleaned_df)
-                        
-                        # Insert data
-                        logger.info(f"Inserting {len(cleaned_df)} rows into {table_name}")
-                        conn_manager.insert_dataframe_to_rds(cleaned_df, table_name)
-                        logger.info(f"Successfully inserted data into {table_name}")
-                        success_count += 1
-                        
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Failed to process dataframe {df_index}: {str(e)}")
-                        continue
-                
-                if success_count > 0:
-                    total_processed += 1
-                    
-                    # Create appropriate success identifier
-                    if main_param_key == 'player_season_combinations':
-                        success_identifier = f"Player {player_id}, Season {season}"
-                    else:
-                        success_identifier = f"{main_param_key}={missing_id}"
-                    
-                    logger.info(f"Successfully processed {success_identifier} ({success_count} dataframes)")
-                else:
-                    total_failed += 1
-                    
-                    # Create appropriate failure identifier  
-                    if main_param_key == 'player_season_combinations':
-                        failure_identifier = f"Player {player_id}, Season {season}"
-                        record_key_value = f"{player_id}_{season}"  # Use combined key for database
-                    else:
-                        failure_identifier = f"{main_param_key}={missing_id}"
-                        record_key_value = missing_id
-                    
-                    record_failed_id(conn_manager, failed_ids_table, f"nba_{endpoint_name.lower()}", 
-                                    main_param_key, record_key_value, "All dataframes failed to process", logger)
-                    logger.error(f"All dataframes failed for {failure_identifier}")
-                
-            except Exception as e:
-                total_failed += 1
-                error_msg = str(e)
-                
-                # Create appropriate error identifier
-                if main_param_key == 'player_season_combinations':
-                    error_identifier = f"Player {player_id}, Season {season}"
-                    record_key_value = f"{player_id}_{season}"  # Use combined key for database
-                else:
-                    error_identifier = f"{main_param_key}={missing_id}"
-                    record_key_value = missing_id
+                for invalid_id, reason in invalid_ids:
+                    write_queue.put((_id_context(main_param_key, invalid_id, static_params),
+                                     None, f"Parameter validation failed: {reason}"))
                 
-                logger.error(f"API call failed for {error_identifier}: {error_msg}")
-                record_failed_id(conn_manager, failed_ids_table, f"nba_{endpoint_name.lower()}", 
-                                main_param_key, record_key_value, error_msg, logger)
-                continue
+                with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool:
+                    for batch_start in range(0, len(fetch_ids), FETCH_BATCH_SIZE):
+                        batch = range(batch_start, min(batch_start + FETCH_BATCH_SIZE, len(fetch_ids)))
+                        # map yields in submission order, so the writer sees IDs in order
+                        for fetch_result in fetch_pool.map(fetch, batch):
+                            write_queue.put(fetch_result)
+            finally:
+                # Always release the writer, even if fetching blew up
+                write_queue.put(_WRITER_STOP)
+                limiter.save()
             
-            # Rate limiting between API calls
-            if rate_limit > 0:
-                logger.debug(f"Rate limiting: waiting {rate_limit} seconds...")
-                time.sleep(rate_limit)
+            total_processed, total_failed = writer.result()
         
         # Close connection
         conn_manager.close_connection()
@@ -902,6 +1148,38 @@ def process_single_endpoint_comprehensive(endpoint_name, node_id, rate_limit, lo
         logger.exception("Full error traceback:")
         return {"status": "error", "error": str(e)}
 
+def find_missing_ids_all_leagues(conn_manager, league_tables, endpoint_table_prefix, id_column,
+                                 failed_ids_table, logger):
+    """
+    Run find_missing_ids for every league's master table concurrently
+    
+    The leagues are independent queries, so each one gets its own short-lived
+    connection (a psycopg2 connection can't run two queries at once).
+    
+    Args:
+        league_tables: {league: master_table}
+    
+    Returns:
+        List of missing IDs, concatenated in league_tables order
+    """
+    def find_for_league(table_name):
+        league_conn = RDSConnectionManager(db_config=conn_manager.db_config)
+        if not league_conn.create_connection():
+            logger.error(f"Could not open a connection to check {table_name}")
+            return []
+        try:
+            return find_missing_ids(league_conn, table_name, endpoint_table_prefix,
+                                    id_column, failed_ids_table, logger)
+        finally:
+            league_conn.close_connection()
+    
+    all_missing = []
+    with ThreadPoolExecutor(max_workers=len(league_tables)) as executor:
+        for missing_ids in executor.map(find_for_league, league_tables.values()):
+            all_missing.extend(missing_ids)
+    
+    return all_missing
+
 def find_all_missing_ids(endpoint_config, conn_manager, logger):
     """
     Find all missing IDs for all parameters that need to be resolved from master tables
@@ -911,6 +1189,7 @@ def find_all_missing_ids(endpoint_config, conn_manager, logger):
     """
     missing_ids_by_param = {}
     failed_ids_table = "failed_api_calls"
+    endpoint_prefix = f"nba_{endpoint_config['endpoint'].lower()}"
     
     for param_key, param_source in endpoint_config.get('parameters', {}).items():
         # Handle direct string values (e.g., 'game_id': 'from_mastergames')
@@ -935,7 +1214,6 @@ def find_all_missing_ids(endpoint_config, conn_manager, logger):
         
         if source_value == 'from_mastergames':
             # Find missing game IDs across all leagues
-            all_missing = []
             
             league_tables = {
                 'nba': 'nba_games',
@@ -943,17 +1221,13 @@ def find_all_missing_ids(endpoint_config, conn_manager, logger):
                 'wnba': 'wnba_games'
             }
             
-            for league, table_name in league_tables.items():
-                endpoint_prefix = f"nba_{endpoint_config['endpoint'].lower()}"
-                missing_ids = find_missing_ids(conn_manager, table_name, endpoint_prefix, 
-                                             'gameid', failed_ids_table, logger)
-                all_missing.extend(missing_ids)
+            all_missing = find_missing_ids_all_leagues(conn_manager, league_tables, endpoint_prefix,
+                                                       'gameid', failed_ids_table, logger)
             
             missing_ids_by_param[param_key] = all_missing  # Process ALL missing IDs
             
         elif source_value == 'from_masterplayers':
             # Find missing player IDs across all leagues
-            all_missing = []
             
             league_tables = {
                 'nba': 'nba_players',
@@ -961,11 +1235,8 @@ def find_all_missing_ids(endpoint_config, conn_manager, logger):
                 'wnba': 'wnba_players'
             }
             
-            for league, table_name in league_tables.items():
-                endpoint_prefix = f"nba_{endpoint_config['endpoint'].lower()}"
-                missing_ids = find_missing_ids(conn_manager, table_name, endpoint_prefix, 
-                                             'playerid', failed_ids_table, logger)
-                all_missing.extend(missing_ids)
+            all_missing = find_missing_ids_all_leagues(conn_manager, league_tables, endpoint_prefix,
+                                                       'playerid', failed_ids_table, logger)
                 
             missing_ids_by_param[param_key] = all_missing  # Process ALL missing IDs
             
@@ -982,61 +1253,68 @@ def find_all_missing_ids(endpoint_config, conn_manager, logger):
                 'wnba': 'wnba_players'
             }
             
+            # Endpoint tables that can hold player-season rows (same for every league)
+            try:
+                with conn_manager.get_cursor() as cursor:
+                    cursor.execute("""
+                        SELECT c.relname 
+                        FROM pg_class c 
+                        JOIN pg_namespace n ON n.oid = c.relnamespace 
+                        JOIN pg_attribute a ON a.attrelid = c.oid 
+                        WHERE n.nspname = 'public' 
+                        AND c.relkind IN ('r', 'p')
+                        AND c.relname LIKE %s
+                        AND a.attname IN ('player_id', 'season')
+                        AND NOT a.attisdropped
+                        GROUP BY c.relname
+                        HAVING COUNT(DISTINCT a.attname) = 2
+                    """, (f"{endpoint_prefix}%",))
+                    endpoint_tables = [row[0] for row in cursor.fetchall()]
+            except Exception as e:
+                logger.debug(f"Could not list endpoint tables for {endpoint_prefix}: {e}")
+                endpoint_tables = []
+            
+            # Existing combinations across all endpoint tables, anti-joined in SQL
+            existing_query = " UNION ALL ".join(
+                f"SELECT player_id, season FROM {table} WHERE player_id IS NOT NULL AND season IS NOT NULL"
+                for table in endpoint_tables
+            )
+            
             for league, table_name in league_tables.items():
                 try:
                     logger.info(f"Processing {table_name} for all player-season combinations...")
                     
-                    with conn_manager.get_cursor() as cursor:
-                        # Get ALL unique player-season combinations from master table
-                        cursor.execute(f"""
+                    # ALL unique player-season combinations from master table with no match
+                    # in any endpoint table (set difference via EXCEPT)
+                    query = f"""
+                        WITH master AS (
                             SELECT DISTINCT playerid, season 
                             FROM {table_name} 
                             WHERE playerid IS NOT NULL 
                             AND season IS NOT NULL
-                            ORDER BY season DESC, playerid ASC
-                        """)
-                        
-                        combinations = cursor.fetchall()
-                        
-                        if combinations:
-                            logger.info(f"Found {len(combinations)} player-season combinations in {table_name}")
-                            
-                            # Check which combinations are missing from endpoint tables
-                            endpoint_prefix = f"nba_{endpoint_config['endpoint'].lower()}"
-                            
-                            # Get existing combinations from endpoint tables
-                            cursor.execute("""
-                                SELECT table_name 
-                                FROM information_schema.tables 
-                                WHERE table_schema = 'public' 
-                                AND table_name LIKE %s
-                            """, (f"{endpoint_prefix}%",))
-                            
-                            endpoint_tables = [row[0] for row in cursor.fetchall()]
-                            existing_combinations = set()
-                            
-                            for table in endpoint_tables:
-                                try:
-                                    cursor.execute(f"""
-                                        SELECT DISTINCT player_id, season 
-                                        FROM {table} 
-                                        WHERE player_id IS NOT NULL 
-                                        AND season IS NOT NULL
-                                    """)
-                                    existing = cursor.fetchall()
-                                    existing_combinations.update(existing)
-                                except Exception as e:
-                                    logger.debug(f"Could not check existing data in {table}: {e}")
-                            
-                            # Find missing combinations
-                            all_available = set(combinations)
-                            missing_combinations = all_available - existing_combinations
-                            
-                            logger.info(f"Available: {len(all_available)}, Existing: {len(existing_combinations)}, Missing: {len(missing_combinations)}")
-                            
-                            # Convert to list format for processing
-                            missing_list = list(missing_combinations)
-                            all_combinations.extend(missing_list)
+                        )
+                    """
+                    if existing_query:
+                        query += f"""
+                        , existing AS ({existing_query})
+                        SELECT playerid, season FROM master 
+                        EXCEPT 
+                        SELECT player_id, season FROM existing
+                        """
+                    else:
+                        query += " SELECT m.playerid, m.season FROM master m"
+                    query += " ORDER BY 2 DESC, 1 ASC"
+                    
+                    # Stream the result instead of pulling it all in on execute
+                    missing_count = 0
+                    with conn_manager.get_server_cursor(f"missing_{league}") as cursor:
+                        cursor.execute(query)
+                        for row in cursor:
+                            all_combinations.append(row)
+                            missing_count += 1
+                    
+                    logger.info(f"Missing: {missing_count} player-season combinations in {table_name} "
+                                f"(checked against {len(endpoint_tables)} endpoint tables)")
                             
                 except Exception as e:
                     logger.error(f"Error processing {table_name} for player-season combinations: {e}")
@@ -1054,7 +1332,6 @@ def find_all_missing_ids(endpoint_config, conn_manager, logger):
             
         elif source_value == 'from_masterteams':
             # Find missing team IDs across all leagues
-            all_missing = []
             
             league_tables = {
                 'nba': 'nba_teams',
@@ -1062,11 +1339,8 @@ def find_all_missing_ids(endpoint_config, conn_manager, logger):
                 'wnba': 'wnba_teams'
             }
             
-            for league, table_name in league_tables.items():
-                endpoint_prefix = f"nba_{endpoint_config['endpoint'].lower()}"
-                missing_ids = find_missing_ids(conn_manager, table_name, endpoint_prefix, 
-                                             'teamid', failed_ids_table, logger)
-                all_missing.extend(missing_ids)
+            all_missing = find_missing_ids_all_leagues(conn_manager, league_tables, endpoint_prefix,
+                                                       'teamid', failed_ids_table, logger)
                 
             missing_ids_by_param[param_key] = all_missing  # Process ALL missing IDs
     
@@ -1076,9 +1350,48 @@ def get_current_season():
     """Get current NBA season string"""
     now = datetime.now()
     if now.month >= 10:  # Season starts in October
-        return f"{now.year}-{str(now.year + 1)[2:]}"
+        return f"{now.year}-{(now.year + 1) % 100:02d}"
     else:
-        return f"{now.year - 1}-{str(now.year)[2:]}"
+        return f"{now.year - 1}-{now.year % 100:02d}"
+
+# validate_api_parameters runs once per ID with the same handful of keys
+_GAME_ID_RE = re.compile(r'[0-9]{8,}')
+_ID_KINDS = ('game_id', 'player_id', 'team_id')
+
+@functools.lru_cache(maxsize=None)
+def _param_id_kind(key):
+    """Which ID check applies to a parameter key (e.g. 'player_id_nullable' -> 'player_id')"""
+    return next((kind for kind in _ID_KINDS if kind in key), None)
+
+def split_valid_main_ids(main_param_key, main_ids):
+    """
+    Check the main ID format for the whole list in one vectorized pass
+    
+    Applies the same ID rules as validate_api_parameters, so malformed IDs can
+    be recorded as failed without going through the fetch loop.
+    
+    Returns:
+        tuple: (valid_ids, [(invalid_id, reason), ...]) - valid_ids keeps the input order
+    """
+    id_kind = _param_id_kind(main_param_key)
+    if id_kind is None or not main_ids:
+        return main_ids, []
+    
+    ids = pd.Series(main_ids, dtype=object)
+    if id_kind == 'game_id':
+        # Only string game IDs are checked, same as validate_api_parameters
+        is_str = ids.map(type) == str
+        ok = ~is_str | ids.where(is_str, '').astype('string').str.fullmatch(_GAME_ID_RE.pattern).fillna(False)
+        reason = "Invalid game_id format: {}"
+    else:
+        ok = pd.to_numeric(ids, errors='coerce').gt(0)
+        reason = f"Invalid {id_kind}: {{}}"
+    
+    if ok.all():
+        return main_ids, []
+    valid_ids = ids[ok].tolist()
+    invalid = [(value, reason.format(value)) for value in ids[~ok]]
+    return valid_ids, invalid
 
 def validate_api_parameters(endpoint_name, params, logger):
     """
@@ -1097,28 +1410,28 @@ def validate_api_parameters(endpoint_name, params, logger):
             if value is None:
                 return False, f"Parameter {key} is None"
             
+            id_kind = _param_id_kind(key)
+            if id_kind is None:
+                continue
+            
             # Validate game IDs (should be strings of digits)
-            if 'game_id' in key and isinstance(value, str):
-                if not value.isdigit() or len(value) < 8:
+            if id_kind == 'game_id':
+                if isinstance(value, str) and not _GAME_ID_RE.fullmatch(value):
                     return False, f"Invalid game_id format: {value}"
+                continue
             
-            # Validate player IDs (should be integers or digit strings)
-            if 'player_id' in key:
-                try:
-                    player_id = int(value)
-                    if player_id <= 0:
-                        return False, f"Invalid player_id: {value}"
-                except (ValueError, TypeError):
-                    return False, f"player_id must be numeric: {value}"
-            
-            # Validate team IDs (should be integers)
-            if 'team_id' in key:
+            # Validate player/team IDs (should be integers or digit strings)
+            if type(value) is int:
+                numeric_id = value
+            elif isinstance(value, str) and value.isascii() and value.isdigit():
+                numeric_id = int(value)
+            else:
                 try:
-                    team_id = int(value)
-                    if team_id <= 0:
-                        return False, f"Invalid team_id: {value}"
+                    numeric_id = int(value)
                 except (ValueError, TypeError):
-                    return False, f"team_id must be numeric: {value}"
+                    return False, f"{id_kind} must be numeric: {value}"
+            if numeric_id <= 0:
+                return False, f"Invalid {id_kind}: {value}"
         
         logger.debug(f"Parameters validated successfully for {endpoint_name}")
         return True, ""
@@ -1193,6 +1506,8 @@ def main():
     parser.add_argument('--endpoint', required=True, help='Endpoint name to process')
     parser.add_argument('--node-id', required=True, help='Unique node identifier')
     parser.add_argument('--rate-limit', type=float, default=0.5, help='Rate limit in seconds')
+    parser.add_argument('--fetch-workers', type=int, default=1,
+                        help='Concurrent API calls (still spaced by --rate-limit)')
     parser.add_argument('--db-config', required=True, help='Database configuration JSON file')
     parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
     
@@ -1212,7 +1527,8 @@ def main():
             endpoint_name=args.endpoint,
             node_id=args.node_id,
             rate_limit=args.rate_limit,
-            logger=logger
+            logger=logger,
+            fetch_workers=max(1, args.fetch_workers)
         )
         
         if result["status"] == "complete":
@@ -9,13 +9,16 @@ No static assignment — idle workers automatically pick up remaining work.
 import psycopg2
 import psycopg2.extras
 import json
+import math
 import os
+import re
 import sys
 import time
 import subprocess
 import socket
 import logging
 import argparse
+from datetime import datetime
 
 logging.basicConfig(
     level=logging.INFO,
@@ -105,22 +108,20 @@ def build_season_shards(shard_count, start_year=1996, end_year=None):
         [('1996-97','2003-04'), ('2004-05','2011-12'),
          ('2012-13','2019-20'), ('2020-21','2025-26')]
     """
-    import math
-    from datetime import datetime
     if end_year is None:
         now = datetime.now()
         # NBA season YYYY-YY starting in October of year Y
         end_year = now.year if now.month >= 10 else now.year - 1
     years = list(range(start_year, end_year + 1))
     if shard_count <= 1 or len(years) <= 1:
-        season_of = lambda y: f"{y}-{str(y+1)[-2:]}"
+        season_of = lambda y: f"{y}-{(y+1) % 100:02d}"
         return [(season_of(years[0]), season_of(years[-1]))]
     chunk_size = math.ceil(len(years) / shard_count)
     shards = []
     for i in range(0, len(years), chunk_size):
         chunk = years[i:i + chunk_size]
         first, last = chunk[0], chunk[-1]
-        shards.append((f"{first}-{str(first+1)[-2:]}", f"{last}-{str(last+1)[-2:]}"))
+        shards.append((f"{first}-{(first+1) % 100:02d}", f"{last}-{(last+1) % 100:02d}"))
     return shards
 
 
@@ -379,13 +380,14 @@ if __name__ == '__main__':
         add_sharded_jobs(args.endpoint, shard_count, args.extra_args)
 
     elif args.command == 'status':
-        import re
         summary, jobs = get_queue_status()
         print(f"\n{'='*60}")
         print(f"Queue Summary: {summary}")
         print(f"{'='*60}")
+        status_icon = {'pending': ' ', 'running': '>', 'completed': '+', 'failed': 'X'}
+        since_re = re.compile(r'--since-season\s+(\S+)')
+        until_re = re.compile(r'--until-season\s+(\S+)')
         for j in jobs:
-            status_icon = {'pending': ' ', 'running': '>', 'completed': '+', 'failed': 'X'}
             icon = status_icon.get(j['status'], '?')
             worker = f" @ {j['worker_ip']}" if j['worker_ip'] else ""
             duration = ""
@@ -399,8 +401,8 @@ if __name__ == '__main__':
             # Render season shard range compactly if present
             name = j['endpoint_name']
             extra = j.get('extra_args') or ''
-            since = re.search(r'--since-season\s+(\S+)', extra)
-            until = re.search(r'--until-season\s+(\S+)', extra)
+            since = since_re.search(extra) if extra else None
+            until = until_re.search(extra) if extra else None
             if since or until:
                 name = f"{name} [{since.group(1) if since else '...'}→{until.group(1) if until else '...'}]"
             print(f"  [{icon}] #{j['id']:2d} {name:<46s} {j['status']:<10s}{worker}{duration}{error}")
@@ -17,11 +17,17 @@ Date: September 2025
 """
 
 import argparse
+import functools
+import inspect
 import json
 import logging
 import os
+import random
+import string
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 
@@ -30,9 +36,214 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
 import pandas as pd
+from psycopg2 import sql
+import requests
+from requests.adapters import HTTPAdapter
 import nba_api.stats.endpoints as nbaapi
+from nba_api.stats.library.http import NBAStatsHTTP
 from src.rds_connection_manager import RDSConnectionManager
 
+# orjson parses the large endpoint config several times faster; stdlib json is the fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+from src.api_errors import is_permanent_api_error
+from src.response_cache import (
+    append_manifest, load_cached_response, load_manifest, manifest_key,
+    parse_cache_policy, response_digest, save_cached_response, ttl_for_params
+)
+
+@functools.lru_cache(maxsize=None)
+def _endpoint_param_names(endpoint_class) -> frozenset:
+    """Constructor parameter names of an nba_api endpoint class (fixed per class)"""
+    return frozenset(inspect.signature(endpoint_class.__init__).parameters)
+
+
+# Cleaned column names that collide with SQL keywords (None drops the column)
+SPECIAL_COLUMN_MAPPINGS = {
+    'to': 'turnovers',
+    'from': 'from_field',
+    'order': 'order_field',
+    'group': 'group_field',
+    'select': 'select_field',
+    'where': 'where_field',
+    'having': 'having_field',
+    'union': 'union_field',
+    'user': 'user_field',
+    'rank': None  # Remove rank columns entirely
+}
+
+# Deletes every ASCII character that isn't a letter or digit
+_ASCII_NON_ALNUM = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isalnum()
+))
+
+
+def _alnum_lower(name: str) -> str:
+    """Lowercase name and drop everything but letters and digits"""
+    if name.isascii():
+        return name.lower().translate(_ASCII_NON_ALNUM)
+    # Non-ASCII headers keep the unicode-aware rules
+    return ''.join(c.lower() if c.isalnum() else '' for c in name)
+
+
+# Every season type an endpoint may accept, for comprehensive coverage
+ALL_SEASON_TYPES = [
+    'Regular Season',
+    'Playoffs',
+    'Pre Season',  # Some endpoints use 'Pre Season'
+    'Preseason',   # Some endpoints use 'Preseason' 
+    'All Star',    # All-Star related data
+    'IST'          # In-Season Tournament (introduced 2023-24)
+]
+
+# Every historical season per league season_format: 1996-97 (1996 for the WNBA) through 2026-27
+SEASON_START_YEARS = range(1996, 2027)
+SEASONS_BY_FORMAT = {
+    'two_year': tuple(f"{year}-{(year + 1) % 100:02d}" for year in SEASON_START_YEARS),  # NBA/G-League: 1996-97
+    'single_year': tuple(str(year) for year in SEASON_START_YEARS),                  # WNBA: 1996
+}
+
+# LeagueGameFinder master parameter sets: every season × type through 2025-26,
+# plus the In-Season Tournament from 2023-24 (shared dicts - don't modify)
+LEAGUE_GAME_FINDER_PARAMS = tuple(
+    {'season_nullable': season, 'season_type_nullable': season_type}
+    for season in SEASONS_BY_FORMAT['two_year'][:-1]
+    for season_type in ('Regular Season', 'Playoffs', 'Pre Season', 'All Star') + (('IST',) if season >= '2023-24' else ())
+)
+
+# Master table ID column variations to look for, in order of preference
+MASTER_ID_COLUMNS = {
+    'game_id': ['gameid', 'game_id', 'id'],
+    'player_id': ['personid', 'player_id', 'playerid', 'person_id', 'id'],
+    'team_id': ['teamid', 'team_id', 'id'],
+}
+
+# Combination types whose missing-ID lookup reads another endpoint's tables,
+# so it can't be planned (or run in parallel) before the other endpoints finish
+LOOKAHEAD_UNSAFE_COMBINATIONS = frozenset({'player_team_season'})
+
+# Preserve these column names exactly (system metadata columns)
+PRESERVE_COLUMNS = frozenset({'data_collected_date'})
+
+# Schema lookups go straight to pg_catalog - information_schema views expand
+# into several catalog joins plus privilege checks on every call
+TABLE_EXISTS_SQL = """
+    SELECT EXISTS (
+        SELECT 1 FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public'
+        AND c.relname = %s
+        AND c.relkind IN ('r', 'p')
+    )
+"""
+PUBLIC_TABLES_SQL = """
+    SELECT c.relname FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public'
+    AND c.relkind IN ('r', 'p')
+"""
+
+
+_CONFIG_CACHE = {}  # (path, mtime_ns) -> parsed JSON; shared by every processor in the process
+
+
+def _load_json_config(config_path: str):
+    """
+    Parse a JSON config file, reusing the parsed copy while the file is unchanged
+
+    Callers must treat the result as read-only - it is shared between instances.
+    """
+    key = (config_path, os.stat(config_path).st_mtime_ns)
+    if key not in _CONFIG_CACHE:
+        with open(config_path, 'rb') as f:
+            _CONFIG_CACHE[key] = _json_loads(f.read())
+    return _CONFIG_CACHE[key]
+
+
+# Items fetched ahead of the database insert loop
+FETCH_BATCH_SIZE = 16
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by the API fetch workers
+    
+    Tokens refill at rate per second up to burst; acquire() blocks until one
+    is available, so the combined request rate stays under the API limit.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Retry backoff (seconds) and circuit breaker settings for API calls
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 30.0
+CIRCUIT_FAILURE_THRESHOLD = 5   # Consecutive failed items before pausing the endpoint
+CIRCUIT_COOLDOWN = 60.0         # Seconds to pause once the circuit opens
+SESSION_RECYCLE_CALLS = 25      # Fresh nba_api session every N calls (stale sockets stall)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff so concurrent workers don't retry in lockstep"""
+    return random.uniform(BACKOFF_BASE, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** (attempt + 1)))
+
+
+class CircuitBreaker:
+    """
+    Pauses API calls after a run of consecutive failures
+    
+    Once threshold items in a row have failed, wait() blocks every worker until
+    the cooldown has passed, instead of each one hammering a struggling API.
+    """
+    
+    def __init__(self, threshold: int = CIRCUIT_FAILURE_THRESHOLD, cooldown: float = CIRCUIT_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block while the circuit is open"""
+        with self._lock:
+            remaining = self.open_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+    
+    def record_failure(self) -> bool:
+        """Count a failed item; returns True if this opened the circuit"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures < self.threshold:
+                return False
+            self.consecutive_failures = 0
+            self.open_until = time.monotonic() + self.cooldown
+            return True
+
 
 class NBADataProcessor:
     """
@@ -41,7 +252,10 @@ class NBADataProcessor:
     
     def __init__(self, league: str = 'NBA', test_mode: bool = False,
                  max_items_per_endpoint: int = None, log_level: str = 'INFO',
-                 since_season: str = None, until_season: str = None):
+                 since_season: str = None, until_season: str = None,
+                 cache_policy: str = 'refreshAfterDays=7', api_workers: int = 4,
+                 requests_per_minute: float = 33, dedup_unchanged: bool = True,
+                 sample_seed: int = 0, endpoint_processes: int = 1):
         """
         Initialize the NBA Data Processor
 
@@ -52,27 +266,62 @@ class NBADataProcessor:
             log_level: Logging level
             since_season: Only process games from this season onwards (e.g., '2020-21')
             until_season: Only process games up to and including this season (e.g., '2024-25')
+            cache_policy: API response cache policy ('alwaysRefresh', 'neverRefresh' or 'refreshAfterDays=N')
+            api_workers: Concurrent API calls per endpoint
+            requests_per_minute: Combined API request budget across all workers
+            dedup_unchanged: Skip master responses identical to the last stored payload
+            sample_seed: Seed for the test-mode ID sample
+            endpoint_processes: Regular endpoints processed in parallel, one process each
         """
+        # Kept so worker processes can build an identical processor
+        self._init_kwargs = {
+            'league': league, 'test_mode': test_mode,
+            'max_items_per_endpoint': max_items_per_endpoint, 'log_level': log_level,
+            'since_season': since_season, 'until_season': until_season,
+            'cache_policy': cache_policy, 'api_workers': api_workers,
+            'requests_per_minute': requests_per_minute,
+            'dedup_unchanged': dedup_unchanged, 'sample_seed': sample_seed
+        }
+        self.endpoint_processes = max(1, endpoint_processes)
         self.league = league.upper()
         self.test_mode = test_mode
         self.max_items_per_endpoint = max_items_per_endpoint or (10 if test_mode else None)
+        self.sample_seed = sample_seed
         self.since_season = since_season
         self.until_season = until_season
+        self.cache_ttl = parse_cache_policy(cache_policy)
+        self.api_workers = max(1, api_workers)
+        self.rate_limiter = TokenBucket(rate=requests_per_minute / 60, burst=self.api_workers)
+        self.circuit_breaker = CircuitBreaker()
+        self._calls_since_reset = 0
+        self._session_lock = threading.Lock()
+        self.reset_api_session()
+        self.dedup_unchanged = dedup_unchanged
+        self.manifest = load_manifest()
         
         # Setup logging
         self.logger = self._setup_logging(log_level)
         
         # Load configurations
         self.endpoint_config = self._load_endpoint_config()
+        self._partition_endpoints()
         self.league_config = self._load_league_config()
         self.database_config = self._load_database_config()
         self.parameter_mappings = self._load_parameter_mappings()
+        self._column_name_cache = {}  # source column name -> cleaned name (None = drop)
         
-        # Initialize database connection
-        self.db_manager = RDSConnectionManager(self.database_config)
+        # Initialize database connection (the endpoint planner thread swaps in its own)
+        self._db_manager = RDSConnectionManager(self.database_config)
+        self._thread_db = threading.local()
+        self._table_columns = {}  # table_name -> column names, filled on first use
+        self._master_column_names = {}  # (master_type, table_name) -> resolved ID column
+        self._unique_columns = {}  # table_name -> NOT NULL columns with a single-column unique index
+        self._known_tables = set()  # tables confirmed to exist this run
+        self._known_tables_loaded = False  # seeded from the catalog on first _table_exists
         
         # Get current season info
         self.current_season = self._get_current_season()
+        self._all_seasons = None  # Built by _get_all_seasons on first use
         self.is_current_season = True  # Will be set per season iteration
         
         self.logger.info(f"=== NBA Data Processor Initialized ===")
@@ -114,8 +363,7 @@ class NBADataProcessor:
         """Load endpoint configuration from JSON"""
         config_path = os.path.join(project_root, 'config', 'endpoint_config.json')
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = _load_json_config(config_path)
             self.logger.info(f"Loaded {len(config['endpoints'])} endpoint configurations")
             return config
         except Exception as e:
@@ -126,8 +374,7 @@ class NBADataProcessor:
         """Load league configuration"""
         config_path = os.path.join(project_root, 'config', 'leagues_config.json')
         try:
-            with open(config_path, 'r') as f:
-                leagues = json.load(f)
+            leagues = _load_json_config(config_path)
             
             # Find our league
             league_config = None
@@ -150,8 +397,7 @@ class NBADataProcessor:
         """Load database configuration"""
         config_path = os.path.join(project_root, 'config', 'database_config.json')
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = _load_json_config(config_path)
             return {
                 'host': config['host'],
                 'database': config['name'],
@@ -169,8 +415,7 @@ class NBADataProcessor:
         """Load parameter mappings for consistent column naming"""
         config_path = os.path.join(project_root, 'config', 'parameter_mappings.json')
         try:
-            with open(config_path, 'r') as f:
-                mappings_config = json.load(f)
+            mappings_config = _load_json_config(config_path)
             self.logger.info("Loaded parameter mappings for consistent column naming")
             return mappings_config
         except FileNotFoundError:
@@ -191,9 +436,9 @@ class NBADataProcessor:
         if self.league_config['season_format'] == 'two_year':
             # NBA/G-League: 2024-25 format
             if current_date.month >= 10:  # Season starts in October
-                season = f"{current_year}-{str(current_year + 1)[-2:]}"
+                season = f"{current_year}-{(current_year + 1) % 100:02d}"
             else:
-                season = f"{current_year - 1}-{str(current_year)[-2:]}"
+                season = f"{current_year - 1}-{current_year % 100:02d}"
         else:
             # WNBA: 2024 format
             if current_date.month >= 5:  # WNBA season roughly May-Oct
@@ -204,25 +449,15 @@ class NBADataProcessor:
         return season
     
     def _get_all_season_types(self) -> List[str]:
-        """Get all possible season types for comprehensive coverage"""
-        return [
-            'Regular Season',
-            'Playoffs',
-            'Pre Season',  # Some endpoints use 'Pre Season'
-            'Preseason',   # Some endpoints use 'Preseason' 
-            'All Star',    # All-Star related data
-            'IST'          # In-Season Tournament (introduced 2023-24)
-        ]
+        """Get all possible season types for comprehensive coverage (shared list - don't modify)"""
+        return ALL_SEASON_TYPES
     
     def _get_all_seasons(self) -> List[str]:
-        """Get all historical seasons for comprehensive coverage"""
-        seasons = []
-        for year in range(1996, 2027):  # 1996-97 through 2026-27
-            if self.league_config['season_format'] == 'two_year':
-                seasons.append(f"{year}-{str(year+1)[2:]}")  # NBA/G-League: 1996-97 format
-            else:
-                seasons.append(str(year))  # WNBA: single year format
-        return seasons
+        """Get all historical seasons for comprehensive coverage (built once - don't modify)"""
+        if self._all_seasons is None:
+            # A list, not the shared tuple - psycopg2 adapts lists to SQL arrays
+            self._all_seasons = list(SEASONS_BY_FORMAT[self.league_config['season_format']])
+        return self._all_seasons
     
     def _build_complete_param_set(self, season: str, season_type: str, season_param: str, season_type_param: str, required_params: List[str]) -> dict:
         """Build a complete parameter set with all required parameters and proper defaults"""
@@ -249,11 +484,7 @@ class NBADataProcessor:
         Get endpoints that have a 'master' field - these must be processed first
         Returns list of (endpoint_name, config) tuples
         """
-        master_endpoints = []
-        
-        for endpoint_name, config in self.endpoint_config['endpoints'].items():
-            if 'master' in config:
-                master_endpoints.append((endpoint_name, config))
+        master_endpoints = list(self._master_endpoints)
         
         self.logger.info(f"Found {len(master_endpoints)} master endpoints")
         for endpoint_name, config in master_endpoints:
@@ -267,29 +498,45 @@ class NBADataProcessor:
         Excludes master endpoints (they're processed separately)
         Returns list of (endpoint_name, config) tuples
         """
-        processable_endpoints = []
-
-        for endpoint_name, config in self.endpoint_config['endpoints'].items():
-            # Skip if it's a master endpoint
-            if 'master' in config:
-                continue
-
-            # Include all endpoints with a non-None priority
-            priority = config.get('priority')
-            if priority is not None and priority != 'None':
-                processable_endpoints.append((endpoint_name, config))
+        processable_endpoints = list(self._processable_endpoints)
 
         self.logger.info(f"Found {len(processable_endpoints)} processable endpoints")
         return processable_endpoints
     
+    @property
+    def db_manager(self) -> RDSConnectionManager:
+        """Connection manager for the calling thread - psycopg2 connections aren't shared"""
+        return getattr(self._thread_db, 'manager', None) or self._db_manager
+    
     def get_table_prefix(self) -> str:
         """Get table prefix for current league"""
         return self.league.lower()
     
     def is_master_endpoint(self, endpoint_name: str) -> bool:
         """Check if this endpoint is designated as a master endpoint"""
-        config = self.endpoint_config.get('endpoints', {}).get(endpoint_name, {})
-        return 'master' in config
+        return endpoint_name in self._master_endpoint_names
+    
+    def _partition_endpoints(self):
+        """
+        Split the endpoint config into master and processable endpoints in one pass
+        
+        The config is fixed for the life of the processor, so the lists are
+        built once here instead of rescanning every endpoint on each call.
+        """
+        self._master_endpoints = []
+        self._processable_endpoints = []
+        
+        for endpoint_name, config in self.endpoint_config['endpoints'].items():
+            if 'master' in config:
+                self._master_endpoints.append((endpoint_name, config))
+                continue
+            
+            # Include all endpoints with a non-None priority
+            priority = config.get('priority')
+            if priority is not None and priority != 'None':
+                self._processable_endpoints.append((endpoint_name, config))
+        
+        self._master_endpoint_names = frozenset(name for name, _ in self._master_endpoints)
     
     def get_master_designation(self, endpoint_name: str) -> str:
         """Get the master designation (game_id, player_id, etc.) for a master endpoint"""
@@ -310,54 +557,81 @@ class NBADataProcessor:
         else:
             return f"master_{prefix}_{master_type}"
     
+    def _table_exists(self, cursor, table_name: str) -> bool:
+        """
+        Whether table_name exists, asking the database only until it does
+        
+        The first call seeds _known_tables (shared with create_table_if_needed)
+        with every public table in one catalog query, so endpoints whose tables
+        already exist cost no round trip. Only positive answers are remembered -
+        a missing table may be created later this run, so those are rechecked.
+        """
+        if not self._known_tables_loaded:
+            cursor.execute(PUBLIC_TABLES_SQL)
+            self._known_tables.update(row[0] for row in cursor.fetchall())
+            self._known_tables_loaded = True
+        if table_name in self._known_tables:
+            return True
+        cursor.execute(TABLE_EXISTS_SQL, (table_name,))
+        exists = cursor.fetchone()[0]
+        if exists:
+            self._known_tables.add(table_name)
+        return exists
+    
+    def _get_table_columns(self, table_name: str) -> set:
+        """
+        Column names of a table, read from pg_catalog once per run
+        
+        Master tables don't change shape during a run, so every endpoint that
+        needs their ID column reuses the same lookup.
+        """
+        if table_name not in self._table_columns:
+            with self.db_manager.get_cursor() as cursor:
+                cursor.execute("""
+                    SELECT a.attname FROM pg_attribute a
+                    JOIN pg_class c ON c.oid = a.attrelid
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = 'public' AND c.relname = %s
+                    AND a.attnum > 0 AND NOT a.attisdropped
+                """, (table_name,))
+                self._table_columns[table_name] = {row[0] for row in cursor.fetchall()}
+        return self._table_columns[table_name]
+    
+    def _distinct_for(self, cursor, table_name: str, column: str) -> sql.SQL:
+        """
+        DISTINCT for a SELECT of column from table_name, unless it's already unique
+        
+        A NOT NULL column with a single-column unique index (e.g. a primary key)
+        can't repeat, so the sort/hash DISTINCT would do is skipped.
+        """
+        if table_name not in self._unique_columns:
+            cursor.execute("""
+                SELECT a.attname FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+                WHERE n.nspname = 'public' AND c.relname = %s
+                AND i.indisunique AND i.indnatts = 1 AND i.indpred IS NULL
+                AND a.attnotnull
+            """, (table_name,))
+            self._unique_columns[table_name] = {row[0] for row in cursor.fetchall()}
+        return sql.SQL("" if column in self._unique_columns[table_name] else "DISTINCT")
+    
     def get_master_table_column_name(self, master_type: str, table_name: str) -> str:
-        """Get the correct column name for the master table"""
+        """Get the correct column name for the master table (resolved once per table)"""
+        key = (master_type, table_name)
+        if key not in self._master_column_names:
+            self._master_column_names[key] = self._resolve_master_column_name(master_type, table_name)
+        return self._master_column_names[key]
+    
+    def _resolve_master_column_name(self, master_type: str, table_name: str) -> str:
+        """Pick the first preferred ID column the master table actually has"""
         try:
-            with self.db_manager.get_cursor() as cursor:
-                if master_type == 'game_id':
-                    # Check for game ID column variations
-                    possible_columns = ['gameid', 'game_id', 'id']
-                    for col in possible_columns:
-                        cursor.execute("""
-                            SELECT EXISTS (
-                                SELECT FROM information_schema.columns 
-                                WHERE table_name = %s AND column_name = %s
-                            )
-                        """, (table_name, col))
-                        
-                        if cursor.fetchone()[0]:
-                            self.logger.info(f"Found game ID column: {col} in {table_name}")
-                            return col
-                
-                elif master_type == 'player_id':
-                    # Check for player ID column variations
-                    possible_columns = ['personid', 'player_id', 'playerid', 'person_id', 'id']
-                    for col in possible_columns:
-                        cursor.execute("""
-                            SELECT EXISTS (
-                                SELECT FROM information_schema.columns 
-                                WHERE table_name = %s AND column_name = %s
-                            )
-                        """, (table_name, col))
-                        
-                        if cursor.fetchone()[0]:
-                            self.logger.info(f"Found player ID column: {col} in {table_name}")
-                            return col
-                
-                elif master_type == 'team_id':
-                    # Check for team ID column variations
-                    possible_columns = ['teamid', 'team_id', 'id']
-                    for col in possible_columns:
-                        cursor.execute("""
-                            SELECT EXISTS (
-                                SELECT FROM information_schema.columns 
-                                WHERE table_name = %s AND column_name = %s
-                            )
-                        """, (table_name, col))
-                        
-                        if cursor.fetchone()[0]:
-                            self.logger.info(f"Found team ID column: {col} in {table_name}")
-                            return col
+            table_columns = self._get_table_columns(table_name)
+            for col in MASTER_ID_COLUMNS.get(master_type, []):
+                if col in table_columns:
+                    self.logger.debug(f"Found {master_type} column: {col} in {table_name}")
+                    return col
         
         except Exception as e:
             self.logger.error(f"Error finding column name for {master_type} in {table_name}: {e}")
@@ -372,80 +646,82 @@ class NBADataProcessor:
         else:
             return 'id'
     
+    def _clean_column_name(self, col) -> Optional[str]:
+        """
+        Cleaned, mapped name for one source column, or None if it should be dropped
+
+        Depends only on the name and the (fixed) parameter mappings, so results
+        are cached for the life of the processor.
+        """
+        if col in self._column_name_cache:
+            return self._column_name_cache[col]
+        
+        # Convert to lowercase for consistency
+        col_lower = str(col).lower()
+        
+        # Preserve certain system columns exactly
+        if col_lower in PRESERVE_COLUMNS:
+            cleaned = col_lower
+        else:
+            # Apply parameter mappings first (for standardized naming)
+            parameter_mappings = self.parameter_mappings.get("mappings", {})
+            if col_lower in parameter_mappings:
+                mapped_name = parameter_mappings[col_lower]
+                # Clean the mapped name but preserve underscores for IDs
+                if '_id' in mapped_name.lower():
+                    cleaned = mapped_name.lower()
+                else:
+                    cleaned = _alnum_lower(mapped_name)
+            else:
+                # Preserve underscores for ID columns, remove other special chars
+                if '_id' in col_lower or col_lower.endswith('id'):
+                    cleaned = col_lower
+                else:
+                    # Convert to lowercase and remove special characters
+                    cleaned = _alnum_lower(col_lower)
+            
+            # Handle special cases (None marks the column for removal)
+            if cleaned in SPECIAL_COLUMN_MAPPINGS:
+                cleaned = SPECIAL_COLUMN_MAPPINGS[cleaned]
+        
+        self._column_name_cache[col] = cleaned
+        return cleaned
+    
     def clean_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Clean column names for PostgreSQL compatibility with special handling
         Apply parameter mappings for consistent naming
         """
-        # Special case mappings
-        special_mappings = {
-            'to': 'turnovers',
-            'from': 'from_field',
-            'order': 'order_field',
-            'group': 'group_field',
-            'select': 'select_field',
-            'where': 'where_field',
-            'having': 'having_field',
-            'union': 'union_field',
-            'user': 'user_field',
-            'rank': None  # Remove rank columns entirely
-        }
-        
-        # Preserve these column names exactly (system metadata columns)
-        preserve_columns = {
-            'data_collected_date'
-        }
-        
         cleaned_columns = []
+        seen = set()
+        next_suffix = {}  # base name -> next suffix to try
         columns_to_drop = []
         
         for i, col in enumerate(df.columns):
-            # Convert to lowercase for consistency
-            col_lower = str(col).lower()
-            
-            # Preserve certain system columns exactly
-            if col_lower in preserve_columns:
-                cleaned = col_lower
-            else:
-                # Apply parameter mappings first (for standardized naming)
-                parameter_mappings = self.parameter_mappings.get("mappings", {})
-                if col_lower in parameter_mappings:
-                    mapped_name = parameter_mappings[col_lower]
-                    # Clean the mapped name but preserve underscores for IDs
-                    if '_id' in mapped_name.lower():
-                        cleaned = mapped_name.lower()
-                    else:
-                        cleaned = ''.join(c.lower() if c.isalnum() else '' for c in mapped_name)
-                else:
-                    # Preserve underscores for ID columns, remove other special chars
-                    if '_id' in col_lower or col_lower.endswith('id'):
-                        cleaned = col_lower
-                    else:
-                        # Convert to lowercase and remove special characters
-                        cleaned = ''.join(c.lower() if c.isalnum() else '' for c in col_lower)
-                
-                # Handle special cases
-                if cleaned in special_mappings:
-                    if special_mappings[cleaned] is None:
-                        # Mark for removal
-                        columns_to_drop.append(i)
-                        continue
-                    else:
-                        cleaned = special_mappings[cleaned]
+            cleaned = self._clean_column_name(col)
+            if cleaned is None:
+                # Mark for removal
+                columns_to_drop.append(i)
+                continue
             
-            # Ensure no duplicates by adding suffix if needed
-            original_cleaned = cleaned
-            suffix = 1
-            while cleaned in cleaned_columns:
+            # Ensure no duplicates by adding suffix if needed; resume from the last
+            # suffix used for this name instead of re-probing _1, _2, ... each time
+            if cleaned in seen:
+                original_cleaned = cleaned
+                suffix = next_suffix.get(original_cleaned, 1)
                 cleaned = f"{original_cleaned}_{suffix}"
-                suffix += 1
+                while cleaned in seen:  # a source column may already be named e.g. pts_1
+                    suffix += 1
+                    cleaned = f"{original_cleaned}_{suffix}"
+                next_suffix[original_cleaned] = suffix + 1
             
+            seen.add(cleaned)
             cleaned_columns.append(cleaned)
         
         # Drop columns marked for removal (like 'rank' columns)
         if columns_to_drop:
             df = df.drop(df.columns[columns_to_drop], axis=1)
-            self.logger.debug(f"Dropped {len(columns_to_drop)} rank columns")
+            self.logger.debug("Dropped %d rank columns", len(columns_to_drop))
         
         # Apply cleaned column names
         df.columns = cleaned_columns
@@ -462,19 +738,23 @@ class NBADataProcessor:
             required_params: List of required parameter names
             param_values: Dict of parameter values used in API call
         """
+        mappings = self.parameter_mappings.get("mappings", {})
+        existing = {str(col).lower() for col in df.columns}
+        
         for param in required_params:
             # Use parameter mappings for standardized column name
-            mappings = self.parameter_mappings.get("mappings", {})
             standard_param = mappings.get(param, param)
             
             # Clean the standardized parameter name for column naming
-            clean_param = ''.join(c.lower() if c.isalnum() else '' for c in standard_param)
+            clean_param = _alnum_lower(standard_param)
             
             # Check if this parameter column already exists
-            if clean_param not in [col.lower() for col in df.columns]:
+            if clean_param not in existing:
                 # Add the column to the front
                 df.insert(0, clean_param, param_values.get(param))
-                self.logger.debug(f"Added missing ID column: {clean_param} = {param_values.get(param)} (from API param: {param})")
+                existing.add(clean_param)
+                self.logger.debug("Added missing ID column: %s = %s (from API param: %s)",
+                                  clean_param, param_values.get(param), param)
         
         return df
     
@@ -500,8 +780,6 @@ class NBADataProcessor:
         Returns:
             Dictionary mapping alphabetical names to DataFrames
         """
-        import string
-
         matched_data = {}
 
         # Use uppercase letters A, B, C, D... for naming
@@ -514,7 +792,7 @@ class NBADataProcessor:
                     # For 26+, use AA, AB, etc.
                     suffix = string.ascii_uppercase[i // 26 - 1] + string.ascii_uppercase[i % 26]
                 matched_data[suffix] = df
-                self.logger.debug(f"Assigned dataframe {i} to suffix {suffix}: {df.shape}")
+                self.logger.debug("Assigned dataframe %d to suffix %s: %s", i, suffix, df.shape)
 
         self.logger.info(f"Assigned {len(matched_data)} datasets for {endpoint_name} with alphabetical suffixes")
         return matched_data
@@ -530,25 +808,96 @@ class NBADataProcessor:
         Returns:
             True if table exists or was created successfully
         """
+        # Tables are never dropped mid-run, so one confirmation per table is enough
+        if table_name in self._known_tables:
+            return True
+        
         try:
             if self.db_manager.check_table_exists(table_name):
                 self.logger.debug(f"Table {table_name} already exists")
+                self._known_tables.add(table_name)
                 return True
             
             # Use the DataFrame as-is since it should already be processed
             self.db_manager.create_table(table_name, df)
             self.logger.info(f"Created table: {table_name}")
+            self._known_tables.add(table_name)
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to create table {table_name}: {e}")
             return False
     
+    def prepare_dataframe(self, df: pd.DataFrame, required_params: List[str],
+                          param_values: dict) -> pd.DataFrame:
+        """
+        Per-response preprocessing: add missing ID columns and clean column names
+        
+        Modifies df in place; callers that need the original should pass a copy.
+        """
+        df = self.add_missing_id_columns(df, required_params, param_values)
+        return self.clean_column_names(df)
+    
+    def insert_prepared_dataframes(self, table_name: str, frames: List[pd.DataFrame]) -> bool:
+        """
+        Insert one or more prepared DataFrames for the same table in a single write
+        
+        The frames are concatenated once and the metadata columns are added to
+        the combined frame, instead of once per API response. If the combined
+        write fails, each frame is retried on its own so one bad response
+        doesn't keep the rest of the batch out of the table.
+        
+        Returns:
+            True if every frame was inserted
+        """
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            self.logger.warning(f"Empty DataFrame for {table_name}, skipping insert")
+            return False
+        
+        if self._write_frames(table_name, frames):
+            return True
+        if len(frames) == 1:
+            return False
+        
+        self.logger.warning(f"Batch insert into {table_name} failed, retrying {len(frames)} responses one at a time")
+        stored = sum(1 for frame in frames if self._write_frames(table_name, [frame]))
+        self.logger.info(f"Inserted {stored}/{len(frames)} responses into {table_name} individually")
+        return stored == len(frames)
+    
+    def _write_frames(self, table_name: str, frames: List[pd.DataFrame]) -> bool:
+        """Concatenate prepared frames and write them to table_name in one COPY"""
+        try:
+            combined_df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            
+            # Add metadata columns
+            combined_df = self.add_metadata_columns(combined_df)
+            
+            # Apply the database-side name cleaning before the table is created,
+            # so CREATE TABLE and COPY see the same column names
+            combined_df = self.db_manager.clean_column_names_inplace(combined_df)
+            
+            # Ensure table exists
+            if not self.create_table_if_needed(table_name, combined_df):
+                return False
+            
+            # Bulk load with COPY
+            self.db_manager.copy_dataframe_to_rds(combined_df, table_name)
+            self.logger.info(f"Inserted {len(combined_df)} rows into {table_name} ({len(frames)} responses)")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to insert data into {table_name}: {e}")
+            return False
+    
     def insert_dataframe_to_table(self, df: pd.DataFrame, table_name: str, 
                                  required_params: List[str], param_values: dict) -> bool:
         """
         Insert DataFrame to database table with proper preprocessing
         
+        df is modified in place (ID columns, renamed columns, metadata) rather
+        than copied; pass df.copy() if the original is still needed.
+        
         Args:
             df: DataFrame to insert
             table_name: Target table name
@@ -558,35 +907,17 @@ class NBADataProcessor:
         Returns:
             True if insertion successful
         """
+        if df.empty:
+            self.logger.warning(f"Empty DataFrame for {table_name}, skipping insert")
+            return False
+        
         try:
-            if df.empty:
-                self.logger.warning(f"Empty DataFrame for {table_name}, skipping insert")
-                return False
-            
-            # Preprocess the DataFrame
-            processed_df = df.copy()
-            
-            # Add missing ID columns if needed
-            processed_df = self.add_missing_id_columns(processed_df, required_params, param_values)
-            
-            # Clean column names
-            processed_df = self.clean_column_names(processed_df)
-            
-            # Add metadata columns
-            processed_df = self.add_metadata_columns(processed_df)
-            
-            # Ensure table exists
-            if not self.create_table_if_needed(table_name, processed_df):
-                return False
-            
-            # Insert the data
-            self.db_manager.insert_dataframe_to_rds(processed_df, table_name)
-            self.logger.info(f"Inserted {len(processed_df)} rows into {table_name}")
-            return True
-            
+            processed_df = self.prepare_dataframe(df, required_params, param_values)
         except Exception as e:
             self.logger.error(f"Failed to insert data into {table_name}: {e}")
             return False
+        
+        return self.insert_prepared_dataframes(table_name, [processed_df])
     
     def get_missing_ids_for_endpoint(self, endpoint_name: str, config: dict) -> List[Any]:
         """
@@ -610,24 +941,8 @@ class NBADataProcessor:
                     return [{}]
                 elif endpoint_name == 'LeagueGameFinder':
                     # Get ALL NBA seasons × season types for comprehensive game history
-                    param_combinations = []
-                    season_types = ['Regular Season', 'Playoffs', 'Pre Season', 'All Star']
-                    # IST only exists from 2023-24 onwards
-
-                    # NBA seasons from 1996-97 (when current format started) to current
-                    for year in range(1996, 2026):  # Will get 1996-97 through 2025-26
-                        season_str = f"{year}-{str(year+1)[2:]}"  # e.g., "2023-24"
-                        for season_type in season_types:
-                            param_combinations.append({
-                                'season_nullable': season_str,
-                                'season_type_nullable': season_type
-                            })
-                        # Add IST for 2023-24 and later
-                        if year >= 2023:
-                            param_combinations.append({
-                                'season_nullable': season_str,
-                                'season_type_nullable': 'IST'
-                            })
+                    # (built once at import; _build_api_params copies each dict before use)
+                    param_combinations = list(LEAGUE_GAME_FINDER_PARAMS)
 
                     # In test mode, limit to recent season combinations
                     if self.test_mode:
@@ -640,10 +955,7 @@ class NBADataProcessor:
                     return param_combinations
                 elif endpoint_name == 'LeagueGameLog':
                     # Get ALL NBA seasons for comprehensive game log history
-                    seasons = []
-                    for year in range(1996, 2027):  # 1996-97 through 2026-27
-                        season_str = f"{year}-{str(year+1)[2:]}"
-                        seasons.append({'season': season_str})
+                    seasons = [{'season': season_str} for season_str in SEASONS_BY_FORMAT['two_year']]
                     
                     if self.test_mode:
                         seasons = seasons[-2:]  # Last 2 seasons only
@@ -728,6 +1040,23 @@ class NBADataProcessor:
             self.logger.error(f"Error getting missing IDs for {endpoint_name}: {e}")
             return []
     
+    def _sample_ids_query(self, id_column: str, master_table: str,
+                          where: sql.Composable = sql.SQL(""), where_params: tuple = ()) -> Tuple[sql.Composed, tuple]:
+        """
+        Query for a reproducible test-mode sample of IDs from a master table
+        
+        Ordering by a seeded hash gives a spread-out sample that is the same on
+        every run with the same --sample-seed; only the ID column is read.
+        """
+        query = sql.SQL("""
+            SELECT {col} FROM (
+                SELECT DISTINCT {col} FROM {table} WHERE 1=1 {where}
+            ) ids
+            ORDER BY md5({col}::text || %s)
+            LIMIT %s
+        """).format(col=sql.Identifier(id_column), table=sql.Identifier(master_table), where=where)
+        return query, where_params + (str(self.sample_seed), self.max_items_per_endpoint)
+    
     def _get_missing_game_ids(self, endpoint_name: str, master_table: str) -> List[dict]:
         """Get missing game IDs for game-based endpoints by comparing master table vs endpoint table"""
         try:
@@ -735,20 +1064,23 @@ class NBADataProcessor:
                 # Get the correct column name for game ID in master table
                 game_id_column = self.get_master_table_column_name('game_id', master_table)
 
-                # Build season filter clause for since/until bounds
-                season_filter = ""
+                # Build season filter clause for since/until bounds (values passed as parameters)
+                season_clauses = []
+                season_params = ()
                 if self.since_season:
-                    season_filter += f" AND season >= '{self.since_season}'"
+                    season_clauses.append(sql.SQL(" AND season >= %s"))
+                    season_params += (self.since_season,)
                     self.logger.info(f"Filtering games to season >= {self.since_season}")
                 if self.until_season:
-                    season_filter += f" AND season <= '{self.until_season}'"
+                    season_clauses.append(sql.SQL(" AND season <= %s"))
+                    season_params += (self.until_season,)
                     self.logger.info(f"Filtering games to season <= {self.until_season}")
+                season_filter = sql.Composed(season_clauses)
 
                 # For test mode, return some sample game IDs to test the system
                 if self.test_mode:
                     # Get some real game IDs from master table for testing
-                    query = f"SELECT DISTINCT {game_id_column} FROM {master_table} WHERE 1=1 {season_filter} LIMIT %s"
-                    cursor.execute(query, (self.max_items_per_endpoint,))
+                    cursor.execute(*self._sample_ids_query(game_id_column, master_table, season_filter, season_params))
                     game_rows = cursor.fetchall()
 
                     if game_rows:
@@ -763,38 +1095,32 @@ class NBADataProcessor:
                 endpoint_table_name = f"{self.get_table_prefix()}_{endpoint_name.lower()}"
 
                 # Check if endpoint table exists
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables
-                        WHERE table_schema = 'public'
-                        AND table_name = %s
-                    )
-                """, (endpoint_table_name,))
-
-                table_exists = cursor.fetchone()[0]
+                table_exists = self._table_exists(cursor, endpoint_table_name)
 
                 if not table_exists:
                     # Table doesn't exist - all games are missing (first run)
                     self.logger.info(f"Endpoint table {endpoint_table_name} doesn't exist - processing ALL games from master table")
-                    query = f"SELECT DISTINCT {game_id_column} FROM {master_table} WHERE 1=1 {season_filter} ORDER BY {game_id_column}"
-                    cursor.execute(query)
-                    all_games = cursor.fetchall()
-                    missing_games = [{'game_id': row[0]} for row in all_games]
+                    query = sql.SQL("SELECT {distinct} {col} FROM {master} WHERE 1=1 {season_filter} ORDER BY {col}")
 
                 else:
                     # Table exists - find missing games
                     # Note: endpoint tables use 'game_id' as standard, master uses actual column name
-                    query = f"""
-                        SELECT DISTINCT m.{game_id_column}
-                        FROM {master_table} m
-                        LEFT JOIN {endpoint_table_name} e ON m.{game_id_column} = e.gameid
-                        WHERE e.gameid IS NULL {season_filter.replace('season', 'm.season')}
-                        ORDER BY m.{game_id_column}
-                    """
-                    cursor.execute(query)
+                    query = sql.SQL("""
+                        SELECT {distinct} m.{col}
+                        FROM {master} m
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM {endpoint} e WHERE e.gameid = m.{col}
+                        ) {season_filter}
+                        ORDER BY m.{col}
+                    """)
+                query = query.format(col=sql.Identifier(game_id_column), master=sql.Identifier(master_table),
+                                     endpoint=sql.Identifier(endpoint_table_name), season_filter=season_filter,
+                                     distinct=self._distinct_for(cursor, master_table, game_id_column))
 
-                    missing_rows = cursor.fetchall()
-                    missing_games = [{'game_id': row[0]} for row in missing_rows]
+                # Stream from a server-side cursor instead of fetchall()-ing the whole result
+                with self.db_manager.get_server_cursor(f"missing_{endpoint_name.lower()}") as stream:
+                    stream.execute(query, season_params)
+                    missing_games = [{'game_id': row[0]} for row in stream]
 
                 self.logger.info(f"Found {len(missing_games)} missing games for {endpoint_name}")
                 return missing_games
@@ -812,7 +1138,7 @@ class NBADataProcessor:
                 
                 # For test mode, just get some player IDs from the master table
                 if self.test_mode:
-                    cursor.execute(f"SELECT DISTINCT {player_column} FROM {master_table} LIMIT %s", (self.max_items_per_endpoint,))
+                    cursor.execute(*self._sample_ids_query(player_column, master_table))
                     player_rows = cursor.fetchall()
                     
                     if player_rows:
@@ -826,35 +1152,31 @@ class NBADataProcessor:
                 endpoint_table_name = f"{self.get_table_prefix()}_{endpoint_name.lower()}"
                 
                 # Check if endpoint table exists
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s
-                    )
-                """, (endpoint_table_name,))
-                
-                table_exists = cursor.fetchone()[0]
+                table_exists = self._table_exists(cursor, endpoint_table_name)
                 
                 if not table_exists:
                     # Table doesn't exist - all players are missing (first run)
                     self.logger.info(f"Endpoint table {endpoint_table_name} doesn't exist - processing ALL players from master table")
-                    cursor.execute(f"SELECT DISTINCT {player_column} FROM {master_table} ORDER BY {player_column}")
-                    all_players = cursor.fetchall()
-                    missing_players = [{'player_id': row[0]} for row in all_players]
+                    query = sql.SQL("SELECT {distinct} {col} FROM {master} ORDER BY {col}")
                     
                 else:
                     # Table exists - find missing players
-                    cursor.execute(f"""
-                        SELECT DISTINCT m.{player_column} 
-                        FROM {master_table} m
-                        LEFT JOIN {endpoint_table_name} e ON m.{player_column} = e.player_id
-                        WHERE e.player_id IS NULL
-                        ORDER BY m.{player_column}
+                    query = sql.SQL("""
+                        SELECT {distinct} m.{col} 
+                        FROM {master} m
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM {endpoint} e WHERE e.player_id = m.{col}
+                        )
+                        ORDER BY m.{col}
                     """)
-                    
-                    missing_rows = cursor.fetchall()
-                    missing_players = [{'player_id': row[0]} for row in missing_rows]
+                query = query.format(col=sql.Identifier(player_column), master=sql.Identifier(master_table),
+                                     endpoint=sql.Identifier(endpoint_table_name),
+                                     distinct=self._distinct_for(cursor, master_table, player_column))
+                
+                # Stream from a server-side cursor instead of fetchall()-ing the whole result
+                with self.db_manager.get_server_cursor(f"missing_{endpoint_name.lower()}") as stream:
+                    stream.execute(query)
+                    missing_players = [{'player_id': row[0]} for row in stream]
                 
                 self.logger.info(f"Found {len(missing_players)} missing players for {endpoint_name}")
                 return missing_players
@@ -873,7 +1195,7 @@ class NBADataProcessor:
                 # For test mode, return some sample team IDs to test the system
                 if self.test_mode:
                     # Get some real team IDs from master table for testing
-                    cursor.execute(f"SELECT DISTINCT {team_id_column} FROM {master_table} LIMIT %s", (self.max_items_per_endpoint,))
+                    cursor.execute(*self._sample_ids_query(team_id_column, master_table))
                     team_rows = cursor.fetchall()
                     
                     if team_rows:
@@ -888,36 +1210,32 @@ class NBADataProcessor:
                 endpoint_table_name = f"{self.get_table_prefix()}_{endpoint_name.lower()}"
                 
                 # Check if endpoint table exists
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s
-                    )
-                """, (endpoint_table_name,))
-                
-                table_exists = cursor.fetchone()[0]
+                table_exists = self._table_exists(cursor, endpoint_table_name)
                 
                 if not table_exists:
                     # Table doesn't exist - all teams are missing (first run)
                     self.logger.info(f"Endpoint table {endpoint_table_name} doesn't exist - processing ALL teams from master table")
-                    cursor.execute(f"SELECT DISTINCT {team_id_column} FROM {master_table} ORDER BY {team_id_column}")
-                    all_teams = cursor.fetchall()
-                    missing_teams = [{'team_id': row[0]} for row in all_teams]
+                    query = sql.SQL("SELECT {distinct} {col} FROM {master} ORDER BY {col}")
                     
                 else:
                     # Table exists - find missing teams
                     # Note: endpoint tables use 'team_id' as standard, master uses actual column name
-                    cursor.execute(f"""
-                        SELECT DISTINCT m.{team_id_column} 
-                        FROM {master_table} m
-                        LEFT JOIN {endpoint_table_name} e ON m.{team_id_column} = e.team_id
-                        WHERE e.team_id IS NULL
-                        ORDER BY m.{team_id_column}
+                    query = sql.SQL("""
+                        SELECT {distinct} m.{col} 
+                        FROM {master} m
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM {endpoint} e WHERE e.team_id = m.{col}
+                        )
+                        ORDER BY m.{col}
                     """)
-                    
-                    missing_rows = cursor.fetchall()
-                    missing_teams = [{'team_id': row[0]} for row in missing_rows]
+                query = query.format(col=sql.Identifier(team_id_column), master=sql.Identifier(master_table),
+                                     endpoint=sql.Identifier(endpoint_table_name),
+                                     distinct=self._distinct_for(cursor, master_table, team_id_column))
+                
+                # Stream from a server-side cursor instead of fetchall()-ing the whole result
+                with self.db_manager.get_server_cursor(f"missing_{endpoint_name.lower()}") as stream:
+                    stream.execute(query)
+                    missing_teams = [{'team_id': row[0]} for row in stream]
                 
                 self.logger.info(f"Found {len(missing_teams)} missing teams for {endpoint_name}")
                 return missing_teams
@@ -934,24 +1252,13 @@ class NBADataProcessor:
         try:
             with self.db_manager.get_cursor() as cursor:
                 # Check if game logs table exists
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables
-                        WHERE table_schema = 'public'
-                        AND table_name = 'nba_playergamelogs_a'
-                    )
-                """)
-                if not cursor.fetchone()[0]:
+                if not self._table_exists(cursor, 'nba_playergamelogs_a'):
                     self.logger.warning(f"PlayerGameLogs table not found - cannot get player-team combinations for {endpoint_name}")
                     return []
 
                 # Get seasons
-                seasons = []
-                for year in range(1996, 2026):
-                    if self.league == 'WNBA':
-                        seasons.append(str(year))
-                    else:
-                        seasons.append(f"{year}-{str(year+1)[2:]}")
+                season_format = 'single_year' if self.league == 'WNBA' else 'two_year'
+                seasons = list(SEASONS_BY_FORMAT[season_format][:-1])  # Through 2025-26
 
                 if self.test_mode:
                     # Test mode: get a small sample of player-team-season combinations
@@ -1004,100 +1311,51 @@ class NBADataProcessor:
                 player_column = self.get_master_table_column_name('player_id', master_table)
                 
                 # Get all seasons (comprehensive historical range)
-                seasons = []
-                for year in range(1996, 2027):  # 1996-97 through 2026-27
-                    if self.league == 'WNBA':
-                        seasons.append(str(year))  # WNBA uses single year format
-                    else:
-                        seasons.append(f"{year}-{str(year+1)[2:]}")  # NBA uses 1996-97 format
+                seasons = self._get_all_seasons()
 
                 # For test mode, limit seasons and players
                 if self.test_mode:
                     seasons = seasons[-3:]  # Last 3 seasons only
-                    cursor.execute(f"SELECT DISTINCT {player_column} FROM {master_table} LIMIT %s", (5,))
-                    player_rows = cursor.fetchall()
-                    
-                    if not player_rows:
-                        return []
-                    
-                    # Create combinations
-                    combinations = []
-                    for player_row in player_rows:
-                        player_id = player_row[0]
-                        for season in seasons:
-                            combinations.append({
-                                'player_id': player_id,
-                                'season': season
-                            })
+                    # 5 players × those seasons, capped at the per-endpoint limit in SQL
+                    cursor.execute(f"""
+                        SELECT m.player_id, s.season
+                        FROM (SELECT DISTINCT {player_column} AS player_id FROM {master_table} LIMIT 5) m
+                        CROSS JOIN UNNEST(%s::text[]) AS s(season)
+                        ORDER BY m.player_id, s.season
+                        LIMIT %s
+                    """, (seasons, self.max_items_per_endpoint))
+                    combinations = [{'player_id': row[0], 'season': row[1]} for row in cursor.fetchall()]
                     
                     self.logger.info(f"Test mode: Generated {len(combinations)} player-season combinations for {endpoint_name}")
                     return combinations
                 
-                # Production mode: Get all players from master table
-                cursor.execute(f"SELECT DISTINCT {player_column} FROM {master_table} ORDER BY {player_column}")
-                all_players = cursor.fetchall()
-                
-                if not all_players:
-                    self.logger.warning(f"No players found in master table {master_table}")
-                    return []
-                
-                # Check what combinations already exist in endpoint table
+                # Production mode: master players × seasons, built by Postgres
                 endpoint_table_name = f"{self.get_table_prefix()}_{endpoint_name.lower()}"
+                table_exists = self._table_exists(cursor, endpoint_table_name)
                 
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s
+                query = f"""
+                    SELECT m.player_id, s.season
+                    FROM (SELECT DISTINCT {player_column} AS player_id FROM {master_table}) m
+                    CROSS JOIN UNNEST(%s::text[]) AS s(season)
+                """
+                if table_exists:
+                    # Anti-join against what the endpoint table already holds
+                    self.logger.info(f"Finding missing player-season combinations in {endpoint_table_name}")
+                    query += f"""
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM {endpoint_table_name} e
+                        WHERE e.player_id = m.player_id AND e.season = s.season
                     )
-                """, (endpoint_table_name,))
-                
-                table_exists = cursor.fetchone()[0]
-                
-                if not table_exists:
-                    # Table doesn't exist - generate ALL combinations
-                    self.logger.info(f"Endpoint table {endpoint_table_name} doesn't exist - generating ALL player-season combinations")
-                    combinations = []
-                    for player_row in all_players:
-                        player_id = player_row[0]
-                        for season in seasons:
-                            combinations.append({
-                                'player_id': player_id,
-                                'season': season
-                            })
-                    
-                    self.logger.info(f"Generated {len(combinations)} total player-season combinations ({len(all_players)} players × {len(seasons)} seasons)")
-                    return combinations
-                
+                    """
                 else:
-                    # Table exists - find missing combinations
-                    self.logger.info(f"Finding missing player-season combinations in {endpoint_table_name}")
-                    
-                    # Create temp table with all possible combinations
-                    cursor.execute("""
-                        CREATE TEMP TABLE temp_player_seasons AS
-                        SELECT p.player_id, s.season
-                        FROM (SELECT UNNEST(%s::bigint[]) AS player_id) p
-                        CROSS JOIN (SELECT UNNEST(%s::text[]) AS season) s
-                    """, ([row[0] for row in all_players], seasons))
-                    
-                    # Find missing combinations
-                    cursor.execute(f"""
-                        SELECT t.player_id, t.season
-                        FROM temp_player_seasons t
-                        LEFT JOIN {endpoint_table_name} e ON t.player_id = e.player_id AND t.season = e.season
-                        WHERE e.player_id IS NULL
-                        ORDER BY t.player_id, t.season
-                    """)
-                    
-                    missing_rows = cursor.fetchall()
-                    combinations = [{'player_id': row[0], 'season': row[1]} for row in missing_rows]
-                    
-                    # Clean up temp table
-                    cursor.execute("DROP TABLE temp_player_seasons")
-                    
-                    self.logger.info(f"Found {len(combinations)} missing player-season combinations for {endpoint_name}")
-                    return combinations
+                    self.logger.info(f"Endpoint table {endpoint_table_name} doesn't exist - generating ALL player-season combinations")
+                # The product can run to hundreds of thousands of rows - stream it
+                # from a server-side cursor rather than loading it all on execute
+                with self.db_manager.get_server_cursor(f"missing_{endpoint_name.lower()}") as stream:
+                    stream.execute(query + " ORDER BY m.player_id, s.season", (seasons,))
+                    combinations = [{'player_id': row[0], 'season': row[1]} for row in stream]
+                self.logger.info(f"Found {len(combinations)} missing player-season combinations for {endpoint_name}")
+                return combinations
                         
         except Exception as e:
             self.logger.error(f"Error getting missing player-season combinations for {endpoint_name}: {e}")
@@ -1111,96 +1369,49 @@ class NBADataProcessor:
                 team_id_column = self.get_master_table_column_name('team_id', master_table)
             
                 # Get all seasons (comprehensive historical range)
-                seasons = []
-                for year in range(1996, 2027):  # 1996-97 through 2026-27
-                    if self.league == 'WNBA':
-                        seasons.append(str(year))  # WNBA uses single year format
-                    else:
-                        seasons.append(f"{year}-{str(year+1)[2:]}")  # NBA uses 1996-97 format
+                seasons = self._get_all_seasons()
 
                 # For test mode, limit seasons and teams
                 if self.test_mode:
                     seasons = seasons[-3:]  # Last 3 seasons only
-                    cursor.execute(f"SELECT DISTINCT {team_id_column} FROM {master_table} LIMIT %s", (3,))
-                    team_rows = cursor.fetchall()
-                    
-                    if not team_rows:
-                        return []
-                    
-                    # Create combinations
-                    combinations = []
-                    for team_row in team_rows:
-                        team_id = team_row[0]
-                        for season in seasons:
-                            combinations.append({
-                                'team_id': team_id,
-                                'season': season
-                            })
+                    # 3 teams × those seasons, capped at the per-endpoint limit in SQL
+                    cursor.execute(f"""
+                        SELECT m.team_id, s.season
+                        FROM (SELECT DISTINCT {team_id_column} AS team_id FROM {master_table} LIMIT 3) m
+                        CROSS JOIN UNNEST(%s::text[]) AS s(season)
+                        ORDER BY m.team_id, s.season
+                        LIMIT %s
+                    """, (seasons, self.max_items_per_endpoint))
+                    combinations = [{'team_id': row[0], 'season': row[1]} for row in cursor.fetchall()]
                     
                     self.logger.info(f"Test mode: Generated {len(combinations)} team-season combinations for {endpoint_name}")
                     return combinations
             
-            # Production mode: Generate all combinations and check what's missing
+            # Production mode: master teams × seasons, built by Postgres
             with self.db_manager.get_cursor() as cursor:
                 endpoint_table_name = f"{self.get_table_prefix()}_{endpoint_name.lower()}"
+                table_exists = self._table_exists(cursor, endpoint_table_name)
                 
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s
+                query = f"""
+                    SELECT m.team_id, s.season
+                    FROM (SELECT DISTINCT {team_id_column} AS team_id FROM {master_table}) m
+                    CROSS JOIN UNNEST(%s::text[]) AS s(season)
+                """
+                if table_exists:
+                    # Anti-join against what the endpoint table already holds
+                    query += f"""
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM {endpoint_table_name} e
+                        WHERE e.team_id = m.team_id AND e.season = s.season
                     )
-                """, (endpoint_table_name,))
-                
-                table_exists = cursor.fetchone()[0]
-                
-                # Production mode: Get all teams from master table
-                cursor.execute(f"SELECT DISTINCT {team_id_column} FROM {master_table} ORDER BY {team_id_column}")
-                all_teams = cursor.fetchall()
-                
-                if not all_teams:
-                    self.logger.warning(f"No teams found in master table {master_table}")
-                    return []
-                
-                if not table_exists:
-                    # Table doesn't exist - all combinations are missing (first run)
-                    combinations = []
-                    for team_row in all_teams:
-                        team_id = team_row[0]
-                        for season in seasons:
-                            combinations.append({
-                                'team_id': team_id,
-                                'season': season
-                            })
-                    
-                    self.logger.info(f"Generated {len(combinations)} total team-season combinations ({len(all_teams)} teams × {len(seasons)} seasons)")
-                    return combinations
-                
-                else:
-                    # Table exists - find missing combinations by checking each team-season pair
-                    combinations = []
-                    for team_row in all_teams:
-                        team_id = team_row[0]
-                        for season in seasons:
-                            # Check if this specific combination exists
-                            cursor.execute(f"""
-                                SELECT EXISTS (
-                                    SELECT 1 FROM {endpoint_table_name} 
-                                    WHERE team_id = %s AND season = %s
-                                )
-                            """, (team_id, season))
-                            
-                            exists = cursor.fetchone()[0]
-                            if not exists:
-                                combinations.append({
-                                    'team_id': team_id,
-                                    'season': season
-                                })
-                    
-                    cursor.execute("DROP TABLE temp_team_seasons")
-                    
-                    self.logger.info(f"Found {len(combinations)} missing team-season combinations for {endpoint_name}")
-                    return combinations
+                    """
+                # The product can run to hundreds of thousands of rows - stream it
+                # from a server-side cursor rather than loading it all on execute
+                with self.db_manager.get_server_cursor(f"missing_{endpoint_name.lower()}") as stream:
+                    stream.execute(query + " ORDER BY m.team_id, s.season", (seasons,))
+                    combinations = [{'team_id': row[0], 'season': row[1]} for row in stream]
+                self.logger.info(f"Found {len(combinations)} missing team-season combinations for {endpoint_name}")
+                return combinations
                         
         except Exception as e:
             self.logger.error(f"Error getting missing team-season combinations for {endpoint_name}: {e}")
@@ -1250,15 +1461,7 @@ class NBADataProcessor:
             with self.db_manager.get_cursor() as cursor:
                 endpoint_table_name = f"{self.get_table_prefix()}_{endpoint_name.lower()}"
                 
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s
-                    )
-                """, (endpoint_table_name,))
-                
-                table_exists = cursor.fetchone()[0]
+                table_exists = self._table_exists(cursor, endpoint_table_name)
                 
                 if not table_exists:
                     # All combinations are missing - generate comprehensive parameter combinations
@@ -1308,13 +1511,189 @@ class NBADataProcessor:
             self.logger.error(f"Error getting missing season data for {endpoint_name}: {e}")
             return []
     
-    def process_single_endpoint(self, endpoint_name: str, config: dict) -> bool:
+    def _build_api_params(self, endpoint_class, param_values: dict) -> dict:
+        """Add league and season parameters to one set of missing-ID values"""
+        api_params = param_values.copy()
+        
+        # Add league parameter (check for different parameter names)
+        param_names = _endpoint_param_names(endpoint_class)
+        if 'league_id' in param_names:
+            api_params['league_id'] = self.league_config['id']
+        elif 'league_id_nullable' in param_names:
+            api_params['league_id_nullable'] = self.league_config['id']
+        
+        # Add season parameter (preserve from param_values if present, otherwise use current)
+        if 'season' in param_names:
+            api_params['season'] = api_params.get('season', self.current_season)
+        elif 'season_nullable' in param_names:
+            api_params['season_nullable'] = api_params.get('season_nullable', self.current_season)
+        
+        return api_params
+    
+    def reset_api_session(self):
+        """Install a fresh pooled session on nba_api, dropping any stale sockets"""
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.api_workers)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # In-flight calls keep the session they already hold; new calls get this one
+        NBAStatsHTTP.set_session(session)
+        with self._session_lock:
+            self._calls_since_reset = 0
+    
+    def _count_api_call(self):
+        """Recycle the session every SESSION_RECYCLE_CALLS calls, before it goes stale"""
+        with self._session_lock:
+            self._calls_since_reset += 1
+            recycle = self._calls_since_reset >= SESSION_RECYCLE_CALLS
+        if recycle:
+            self.logger.debug("Recycling nba_api HTTP session")
+            self.reset_api_session()
+    
+    def _fetch_dataframes(self, endpoint_name: str, endpoint_class,
+                          api_params: dict) -> Tuple[Optional[List[pd.DataFrame]], Optional[str]]:
+        """
+        Fetch one set of parameters from the cache or the API (with retries)
+        
+        Runs on the fetch worker threads - must not touch the database.
+        
+        Returns:
+            (dataframes, digest): dataframes is None if nothing usable came back;
+            digest is the content hash of a fresh master-endpoint response, else None
+        """
+        self.logger.debug("API call: %s(%s)", endpoint_name, api_params)
+        
+        # Reuse a stored response unless this endpoint builds a master table -
+        # those listings change as games are played, so always refetch them
+        cache_ttl = None
+        if not self.is_master_endpoint(endpoint_name):
+            cache_ttl = ttl_for_params(api_params, self.current_season, self.cache_ttl)
+        cached = load_cached_response(endpoint_name, api_params, cache_ttl, self.logger)
+        if cached is not None:
+            self.logger.debug("Using cached response for %s(%s)", endpoint_name, api_params)
+            return cached, None
+        
+        max_retries = 3
+        dataframes = None
+        digest = None
+        last_error = None
+        permanent_error = False
+        
+        for attempt in range(max_retries):
+            try:
+                # Proactive throttle: every attempt spends a token from the shared bucket
+                self.circuit_breaker.wait()
+                self.rate_limiter.acquire()
+                self._count_api_call()
+                self.logger.info(f"API call attempt {attempt + 1}/{max_retries} for {endpoint_name}")
+                endpoint_instance = endpoint_class(**api_params)
+                dataframes = endpoint_instance.get_data_frames()
+                
+                if dataframes:
+                    self.logger.info(f"API call successful on attempt {attempt + 1}")
+                    if self.is_master_endpoint(endpoint_name):
+                        digest = response_digest(endpoint_instance.nba_response.get_response())
+                    else:
+                        save_cached_response(endpoint_name, api_params, dataframes, self.logger)
+                    break  # Success, exit retry loop
+                else:
+                    self.logger.warning(f"No DataFrames returned for {endpoint_name} on attempt {attempt + 1}")
+                    break  # Empty response is not a retry-able error
+                
+            except Exception as retry_error:
+                last_error = retry_error
+                
+                # Don't retry for permanent errors (bad parameters, no data, etc.)
+                if is_permanent_api_error(retry_error):
+                    self.logger.error(f"Permanent error on attempt {attempt + 1}, not retrying: {retry_error}")
+                    permanent_error = True
+                    break
+                
+                # A failed connection can poison the pooled session - retry on a fresh one
+                if isinstance(retry_error, requests.exceptions.RequestException):
+                    self.reset_api_session()
+                
+                # Retry for temporary errors (timeout, connection, rate limit)
+                if attempt < max_retries - 1:
+                    wait_time = backoff_delay(attempt)
+                    self.logger.warning(f"Temporary error on attempt {attempt + 1}: {retry_error}")
+                    self.logger.info(f"Retrying in {wait_time:.1f} seconds...")
+                    time.sleep(wait_time)
+                else:
+                    self.logger.error(f"All {max_retries} API call attempts failed: {retry_error}")
+        
+        # If we exhausted retries and still have an error, log and move on.
+        # Missing-id logic re-derives this gameid from master vs data on the next run.
+        if dataframes is None and last_error is not None:
+            self.logger.error(f"API call failed after {max_retries} attempts for {endpoint_name}: {last_error}")
+            if not permanent_error and self.circuit_breaker.record_failure():
+                self.logger.warning(f"{CIRCUIT_FAILURE_THRESHOLD} consecutive failures - "
+                                    f"pausing API calls for {CIRCUIT_COOLDOWN:.0f}s")
+            return None, None
+        
+        self.circuit_breaker.record_success()
+        
+        if not dataframes:
+            self.logger.warning(f"No DataFrames returned for {endpoint_name}")
+            return None, None
+        
+        return dataframes, digest
+    
+    def _collect_dataframes(self, endpoint_name: str, config: dict, api_params: dict,
+                            dataframes: List[pd.DataFrame], pending: Dict[str, List[pd.DataFrame]]):
+        """
+        Match fetched DataFrames to their expected names and queue them by target table
+        
+        The queued frames are written by insert_prepared_dataframes, one insert
+        per table per fetch batch.
+        """
+        matched_data = self.match_dataframes_to_expected_data(endpoint_name, dataframes)
+        
+        # Per-call constants, resolved once rather than per dataset
+        is_master = self.is_master_endpoint(endpoint_name)
+        first_dataset = next(iter(matched_data), None)
+        table_base = f"{self.get_table_prefix()}_{endpoint_name.lower()}"
+        
+        # Queue each DataFrame for its respective table
+        for dataset_name, df in matched_data.items():
+            if df is not None and not df.empty:
+                # Special handling for master endpoints
+                if is_master:
+                    # For master endpoints, only use the first dataset and give it a standardized name
+                    if dataset_name == first_dataset:
+                        master_type = self.get_master_designation(endpoint_name)
+                        table_name = self.get_master_table_name(master_type)
+                        self.logger.info(f"Creating master table: {table_name} for {endpoint_name}")
+                    else:
+                        # Skip additional datasets for master endpoints
+                        self.logger.debug("Skipping additional dataset %s for master endpoint %s", dataset_name, endpoint_name)
+                        continue
+                else:
+                    # Regular endpoint - use standard naming
+                    table_name = f"{table_base}_{dataset_name.lower()}"
+                
+                try:
+                    # Use the actual API parameters, not the original param_values.
+                    # The fetched frames aren't reused, so they're prepared in place.
+                    prepared_df = self.prepare_dataframe(df, config.get('required_params', []), api_params)
+                except Exception as e:
+                    self.logger.warning(f"Failed to prepare {dataset_name} for {endpoint_name}: {e}")
+                    continue
+                pending.setdefault(table_name, []).append(prepared_df)
+    
+    def process_single_endpoint(self, endpoint_name: str, config: dict,
+                                missing_ids: Optional[List[Any]] = None) -> bool:
         """
         Process a single endpoint - main processing logic
         
+        API calls run on api_workers threads (throttled by the shared token
+        bucket); results are inserted on this thread in the original order,
+        since the database connection is not shared between threads.
+        
         Args:
             endpoint_name: Name of the endpoint to process
             config: Endpoint configuration dictionary
+            missing_ids: Already-computed result of get_missing_ids_for_endpoint, if any
             
         Returns:
             True if processing completed successfully
@@ -1326,7 +1705,8 @@ class NBADataProcessor:
             endpoint_class = getattr(nbaapi, endpoint_name)
             
             # Get missing IDs for this endpoint
-            missing_ids = self.get_missing_ids_for_endpoint(endpoint_name, config)
+            if missing_ids is None:
+                missing_ids = self.get_missing_ids_for_endpoint(endpoint_name, config)
             
             if not missing_ids:
                 self.logger.info(f"No missing data for {endpoint_name}")
@@ -1334,122 +1714,49 @@ class NBADataProcessor:
             
             self.logger.info(f"Processing {len(missing_ids)} items for {endpoint_name}")
             
-            # Process each set of parameters
-            for i, param_values in enumerate(missing_ids):
+            def fetch(item):
+                i, param_values = item
                 try:
-                    self.logger.debug(f"Processing item {i+1}/{len(missing_ids)} for {endpoint_name}")
-                    
-                    # Add league and season parameters
-                    api_params = param_values.copy()
-                    
-                    # Add league parameter (check for different parameter names)
-                    import inspect
-                    sig = inspect.signature(endpoint_class.__init__)
-                    if 'league_id' in sig.parameters:
-                        api_params['league_id'] = self.league_config['id']
-                    elif 'league_id_nullable' in sig.parameters:
-                        api_params['league_id_nullable'] = self.league_config['id']
-                    
-                    # Add season parameter (preserve from param_values if present, otherwise use current)
-                    if 'season' in sig.parameters:
-                        api_params['season'] = api_params.get('season', self.current_season)
-                    elif 'season_nullable' in sig.parameters:
-                        api_params['season_nullable'] = api_params.get('season_nullable', self.current_season)
-                    
-                    # Make API call with retry logic
-                    self.logger.debug(f"API call: {endpoint_name}({api_params})")
-
-                    max_retries = 3
-                    dataframes = None
-                    last_error = None
-
-                    for attempt in range(max_retries):
+                    self.logger.debug("Processing item %d/%d for %s", i + 1, len(missing_ids), endpoint_name)
+                    api_params = self._build_api_params(endpoint_class, param_values)
+                    return (api_params, *self._fetch_dataframes(endpoint_name, endpoint_class, api_params))
+                except Exception as e:
+                    self.logger.error(f"API call failed for {endpoint_name}: {e}")
+                    return None, None, None
+            
+            # Hand out small batches so at most FETCH_BATCH_SIZE responses wait in memory;
+            # each batch is written with one insert per target table
+            with ThreadPoolExecutor(max_workers=self.api_workers) as fetch_pool:
+                for batch_start in range(0, len(missing_ids), FETCH_BATCH_SIZE):
+                    batch = list(enumerate(missing_ids[batch_start:batch_start + FETCH_BATCH_SIZE], batch_start))
+                    pending = {}
+                    batch_digests = {}
+                    for api_params, dataframes, digest in fetch_pool.map(fetch, batch):
+                        if not dataframes:
+                            continue
+                        if digest is not None:
+                            # Master listings are refetched every run; skip the ones whose
+                            # payload is byte-identical to what was stored last time
+                            key = manifest_key(endpoint_name, api_params)
+                            if self.dedup_unchanged and self.manifest.get(key) == digest:
+                                self.logger.info(f"Unchanged since last run, skipping {endpoint_name}({api_params})")
+                                continue
+                            batch_digests[key] = digest
                         try:
-                            self.logger.info(f"API call attempt {attempt + 1}/{max_retries} for {endpoint_name}")
-                            endpoint_instance = endpoint_class(**api_params)
-                            dataframes = endpoint_instance.get_data_frames()
-
-                            if dataframes:
-                                self.logger.info(f"API call successful on attempt {attempt + 1}")
-                                break  # Success, exit retry loop
-                            else:
-                                self.logger.warning(f"No DataFrames returned for {endpoint_name} on attempt {attempt + 1}")
-                                break  # Empty response is not a retry-able error
-
-                        except Exception as retry_error:
-                            last_error = retry_error
-                            error_str = str(retry_error).lower()
-
-                            # Don't retry for permanent errors (bad parameters, no data, etc.)
-                            permanent_error_indicators = [
-                                'invalid game id', 'invalid player id', 'invalid team id',
-                                'bad request', '400', '401', '403', 'unauthorized', 'forbidden',
-                                'parameter', 'invalid parameter', 'missing required',
-                                "'nonetype' object has no attribute",  # API returned no data for this game
-                                'list index out of range',  # API response missing expected datasets
-                                'expecting value',  # Empty/malformed JSON response
-                            ]
-
-                            if any(indicator in error_str for indicator in permanent_error_indicators):
-                                self.logger.error(f"Permanent error on attempt {attempt + 1}, not retrying: {retry_error}")
-                                break
-
-                            # Retry for temporary errors (timeout, connection, rate limit)
-                            if attempt < max_retries - 1:
-                                wait_time = (attempt + 1) * 2  # Exponential backoff: 2s, 4s
-                                self.logger.warning(f"Temporary error on attempt {attempt + 1}: {retry_error}")
-                                self.logger.info(f"Retrying in {wait_time} seconds...")
-                                time.sleep(wait_time)
-                            else:
-                                self.logger.error(f"All {max_retries} API call attempts failed: {retry_error}")
-
-                    # If we exhausted retries and still have an error, log and continue.
-                    # Missing-id logic re-derives this gameid from master vs data on the next run.
-                    if dataframes is None and last_error is not None:
-                        self.logger.error(f"API call failed after {max_retries} attempts for {endpoint_name}: {last_error}")
-                        continue
-
-                    if not dataframes:
-                        self.logger.warning(f"No DataFrames returned for {endpoint_name}")
-                        continue
-                    
-                    # Match DataFrames to expected names
-                    matched_data = self.match_dataframes_to_expected_data(endpoint_name, dataframes)
-                    
-                    # Insert each DataFrame into its respective table
-                    for dataset_name, df in matched_data.items():
-                        if df is not None and not df.empty:
-                            # Special handling for master endpoints
-                            if self.is_master_endpoint(endpoint_name):
-                                # For master endpoints, only use the first dataset and give it a standardized name
-                                if dataset_name == list(matched_data.keys())[0]:  # First dataset only
-                                    master_type = self.get_master_designation(endpoint_name)
-                                    table_name = self.get_master_table_name(master_type)
-                                    self.logger.info(f"Creating master table: {table_name} for {endpoint_name}")
-                                else:
-                                    # Skip additional datasets for master endpoints
-                                    self.logger.debug(f"Skipping additional dataset {dataset_name} for master endpoint {endpoint_name}")
-                                    continue
-                            else:
-                                # Regular endpoint - use standard naming
-                                table_name = f"{self.get_table_prefix()}_{endpoint_name.lower()}_{dataset_name.lower()}"
-
-                            success = self.insert_dataframe_to_table(
-                                df, table_name,
-                                config.get('required_params', []),
-                                api_params  # Use the actual API parameters, not the original param_values
-                            )
-
-                            if not success:
-                                self.logger.warning(f"Failed to insert {dataset_name} for {endpoint_name}")
+                            self._collect_dataframes(endpoint_name, config, api_params, dataframes, pending)
+                        except Exception as e:
+                            self.logger.error(f"Failed to store data for {endpoint_name}: {e}")
                     
-                    # Rate limiting - increased to reduce API flooding and timeout errors
-                    time.sleep(1.8)  # ~33 requests per minute limit
+                    batch_ok = True
+                    for table_name, frames in pending.items():
+                        if not self.insert_prepared_dataframes(table_name, frames):
+                            batch_ok = False
+                            self.logger.warning(f"Failed to insert {len(frames)} responses into {table_name}")
                     
-                except Exception as e:
-                    error_msg = str(e)
-                    self.logger.error(f"API call failed for {endpoint_name}: {error_msg}")
-                    continue
+                    # Only remember payloads that actually made it into the database
+                    if batch_digests and batch_ok:
+                        self.manifest.update(batch_digests)
+                        append_manifest(batch_digests, self.logger)
             
             self.logger.info(f"Completed processing {endpoint_name}")
             return True
@@ -1457,7 +1764,7 @@ class NBADataProcessor:
         except Exception as e:
             self.logger.error(f"Fatal error processing {endpoint_name}: {e}")
             return False
-    
+
     def run_master_endpoints(self) -> bool:
         """
         Run all master endpoints first - these populate the master tables
@@ -1503,13 +1810,74 @@ class NBADataProcessor:
         
         success_count = 0
         
-        for endpoint_name, config in processable_endpoints:
-            if self.process_single_endpoint(endpoint_name, config):
-                success_count += 1
+        if self.endpoint_processes > 1:
+            # Endpoints write to separate tables, so they can run side by side.
+            # The request budget is shared, so each process gets its slice of it.
+            worker_kwargs = dict(self._init_kwargs)
+            worker_kwargs['requests_per_minute'] = self._init_kwargs['requests_per_minute'] / self.endpoint_processes
+            self.logger.info(f"Processing endpoints in {self.endpoint_processes} processes")
+            
+            # Endpoints that plan from another endpoint's tables wait for the pool to drain
+            deferred = [(endpoint_name, config) for endpoint_name, config in processable_endpoints
+                        if config.get('combination_type') in LOOKAHEAD_UNSAFE_COMBINATIONS]
+            pooled = [(worker_kwargs, endpoint_name, config) for endpoint_name, config in processable_endpoints
+                      if config.get('combination_type') not in LOOKAHEAD_UNSAFE_COMBINATIONS]
+            
+            with ProcessPoolExecutor(max_workers=self.endpoint_processes) as executor:
+                results = executor.map(_process_endpoint_worker, pooled)
+                success_count = sum(1 for ok in results if ok)
+            
+            for endpoint_name, config in deferred:
+                if self.process_single_endpoint(endpoint_name, config):
+                    success_count += 1
+        else:
+            success_count = self._process_endpoints_with_lookahead(processable_endpoints)
         
         self.logger.info(f"Regular endpoints completed: {success_count}/{len(processable_endpoints)} successful")
         return True
     
+    def _process_endpoints_with_lookahead(self, endpoints: List[Tuple[str, dict]]) -> int:
+        """
+        Process endpoints in order, planning the next one while this one runs
+        
+        Most missing-ID lookups read only master tables and the endpoint's own
+        tables, so the next endpoint's lookup runs on a planner thread (with its
+        own connection) while the current one is busy with API calls. The
+        player_team_season lookups read nba_playergamelogs_a, which another
+        endpoint writes, so those are planned inline once the previous endpoint
+        has finished.
+        
+        Returns:
+            Number of endpoints processed successfully
+        """
+        planner_db = RDSConnectionManager(self.database_config)
+        if not planner_db.create_connection():
+            self.logger.warning("Could not open a planner connection - planning endpoints inline")
+            return sum(1 for endpoint_name, config in endpoints
+                       if self.process_single_endpoint(endpoint_name, config))
+        
+        def use_planner_db():
+            self._thread_db.manager = planner_db
+        
+        success_count = 0
+        try:
+            with ThreadPoolExecutor(max_workers=1, initializer=use_planner_db) as planner:
+                def plan_ahead(endpoint_name, config):
+                    if config.get('combination_type') in LOOKAHEAD_UNSAFE_COMBINATIONS:
+                        return None  # Depends on another endpoint's output
+                    return planner.submit(self.get_missing_ids_for_endpoint, endpoint_name, config)
+                
+                next_ids = plan_ahead(*endpoints[0])
+                for i, (endpoint_name, config) in enumerate(endpoints):
+                    missing_ids = next_ids.result() if next_ids is not None else None
+                    next_ids = plan_ahead(*endpoints[i + 1]) if i + 1 < len(endpoints) else None
+                    if self.process_single_endpoint(endpoint_name, config, missing_ids):
+                        success_count += 1
+        finally:
+            planner_db.close_connection()
+        
+        return success_count
+    
     def run_full_collection(self) -> bool:
         """
         Run the complete data collection process
@@ -1545,6 +1913,29 @@ class NBADataProcessor:
         return True
 
 
+_worker_processor = None  # One processor per worker process, reused across endpoints
+
+
+def _process_endpoint_worker(task) -> bool:
+    """
+    Process one endpoint in a worker process
+
+    Each process builds its own processor, so it gets its own database
+    connection and API session instead of sharing the parent's.
+
+    Args:
+        task: (processor kwargs, endpoint name, endpoint config)
+
+    Returns:
+        True if the endpoint was processed successfully
+    """
+    init_kwargs, endpoint_name, config = task
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = NBADataProcessor(**init_kwargs)
+    return _worker_processor.process_single_endpoint(endpoint_name, config)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='NBA Data Collection Engine')
     parser.add_argument('--league', default='NBA', choices=['NBA', 'WNBA', 'G-League'],
@@ -1572,6 +1963,19 @@ if __name__ == "__main__":
                        help='Only process games from this season onwards (e.g., 2020-21)')
     parser.add_argument('--until-season',
                        help='Only process games up to and including this season (e.g., 2024-25)')
+    parser.add_argument('--cache-policy', default='refreshAfterDays=7',
+                       help="API response cache: 'alwaysRefresh', 'neverRefresh' or 'refreshAfterDays=N' "
+                            "(current-season responses always expire within hours)")
+    parser.add_argument('--api-workers', type=int, default=4,
+                       help='Concurrent API calls per endpoint')
+    parser.add_argument('--requests-per-minute', type=float, default=33,
+                       help='Combined API request budget across all workers')
+    parser.add_argument('--no-dedup', action='store_true',
+                       help='Store master responses even if unchanged since the last run')
+    parser.add_argument('--sample-seed', type=int, default=0,
+                       help='Seed for the test-mode ID sample')
+    parser.add_argument('--endpoint-processes', type=int, default=1,
+                       help='Regular endpoints to process in parallel (one process each)')
 
     args = parser.parse_args()
 
@@ -1582,7 +1986,13 @@ if __name__ == "__main__":
         max_items_per_endpoint=args.max_items,
         log_level=args.log_level,
         since_season=args.since_season,
-        until_season=args.until_season
+        until_season=args.until_season,
+        cache_policy=args.cache_policy,
+        api_workers=args.api_workers,
+        requests_per_minute=args.requests_per_minute,
+        dedup_unchanged=not args.no_dedup,
+        sample_seed=args.sample_seed,
+        endpoint_processes=args.endpoint_processes
     )
     
     # Execute based on arguments
@@ -15,9 +15,9 @@ def get_current_season():
     """Get current NBA season string"""
     current_year = datetime.now().year
     if datetime.now().month >= 10:  # Season starts in fall
-        season = f"{current_year}-{str(current_year + 1)[-2:]}"
+        season = f"{current_year}-{(current_year + 1) % 100:02d}"
     else:
-        season = f"{current_year - 1}-{str(current_year)[-2:]}"
+        season = f"{current_year - 1}-{current_year % 100:02d}"
     return season
 
 
@@ -195,7 +195,7 @@ def _resolve_from_master_players_all_seasons(conn_manager, logger):
                         # Generate seasons for this player
                         for year in range(int(from_year), int(to_year) + 1):
                             if year >= 2020:  # Only recent seasons
-                                season = f"{year}-{str(year + 1)[-2:]}"
+                                season = f"{year}-{(year + 1) % 100:02d}"
                                 player_season_combinations.append((person_id, season))
                     
                     logger.info(f"Generated {len(player_season_combinations)} player-season combinations from {table_name}")
@@ -396,11 +396,10 @@ def _find_missing_ids(conn_manager, master_table, endpoint_table_prefix, id_colu
         if not conn_manager.check_table_exists(endpoint_table):
             logger.info(f"Endpoint table {endpoint_table} doesn't exist - all IDs are missing")
             # Get all IDs from master table (limited for initial run)
-            query = f"SELECT DISTINCT {id_column} FROM {master_table} WHERE {id_column} IS NOT NULL LIMIT 100"
-            result = conn_manager.query_database_to_dataframe(query)
-            if result is not None and not result.empty:
-                return result[id_column].tolist()
-            return []
+            # Read the single ID column straight off the cursor - no DataFrame needed
+            with conn_manager.get_cursor() as cursor:
+                cursor.execute(f"SELECT DISTINCT {id_column} FROM {master_table} WHERE {id_column} IS NOT NULL LIMIT 100")
+                return [row[0] for row in cursor.fetchall()]
         
         # Find IDs in master table but not in endpoint table, excluding failed IDs
         query = f"""
@@ -424,9 +423,8 @@ def _find_missing_ids(conn_manager, master_table, endpoint_table_prefix, id_colu
         
         with conn_manager.get_cursor() as cursor:
             cursor.execute(query, (endpoint_table_prefix, id_column))
-            results = cursor.fetchall()
+            missing_ids = [row[0] for row in cursor.fetchall()]
         
-        missing_ids = [row[0] for row in results] if results else []
         logger.info(f"Found {len(missing_ids)} missing {id_column}s in {master_table}")
         return missing_ids
         
@@ -8,6 +8,7 @@ import pandas as pd
 import psycopg2
 from psycopg2.extras import execute_batch
 from psycopg2 import sql
+import io
 import re
 import time
 import logging
@@ -27,6 +28,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# NULL marker for CSV COPY, so empty strings load as '' rather than NULL
+COPY_NULL = '\\N'
+
 
 class RDSConnectionManager:
     """
@@ -207,6 +211,29 @@ class RDSConnectionManager:
             logger.error(f"[ERROR] Database operation failed: {e}")
             raise
 
+    @contextmanager
+    def get_server_cursor(self, name: str, itersize: int = 10000):
+        """
+        Context manager for a named (server-side) cursor
+        
+        Rows are streamed from Postgres itersize at a time while iterating,
+        instead of the whole result set being loaded on execute.
+        """
+        if not self.ensure_connection():
+            raise Exception("Could not establish database connection")
+        
+        cursor = self.connection.cursor(name=name)
+        cursor.itersize = itersize
+        try:
+            yield cursor
+            cursor.close()
+            self.connection.commit()
+        except Exception as e:
+            if self.connection:
+                self.connection.rollback()
+            logger.error(f"[ERROR] Database operation failed: {e}")
+            raise
+
     def execute_query(self, query: str, params: tuple = None) -> Optional[Any]:
         """
         Execute a query with automatic connection management
@@ -253,34 +280,48 @@ class RDSConnectionManager:
 
     # === DATA UTILITY FUNCTIONS (Consolidated from allintwo files) ===
 
+    # PostgreSQL reserved keywords that need special handling
+    RESERVED_KEYWORDS = {
+        'to': 'turnovers',
+        'from': 'from_field', 
+        'order': 'order_field',
+        'group': 'group_field',
+        'select': 'select_field',
+        'where': 'where_field',
+        'having': 'having_field',
+        'union': 'union_field',
+        'user': 'user_field'
+    }
+
+    def _clean_column_name(self, col):
+        """Remove special characters and spaces, lowercase, and remap reserved keywords"""
+        cleaned = re.sub(r'[^a-zA-Z0-9]', '', col).lower()
+        return self.RESERVED_KEYWORDS.get(cleaned, cleaned)
+
     def clean_column_names(self, df):
         """
         Clean column names for PostgreSQL compatibility with reserved keyword handling
         Enhanced version from allintwo_1.py
         """
-        # PostgreSQL reserved keywords that need special handling
-        reserved_keywords = {
-            'to': 'turnovers',
-            'from': 'from_field', 
-            'order': 'order_field',
-            'group': 'group_field',
-            'select': 'select_field',
-            'where': 'where_field',
-            'having': 'having_field',
-            'union': 'union_field',
-            'user': 'user_field'
-        }
-        
-        # Function to remove special characters and spaces, and convert to lowercase
-        cleaned_columns = []
-        for col in df.columns:
-            cleaned = re.sub(r'[^a-zA-Z0-9]', '', col).lower()
-            # Handle reserved keywords
-            if cleaned in reserved_keywords:
-                cleaned = reserved_keywords[cleaned]
-            cleaned_columns.append(cleaned)
-        
-        df.columns = cleaned_columns
+        cleaned = [self._clean_column_name(col) for col in df.columns]
+        if cleaned != list(df.columns):
+            df.columns = cleaned
+        return df
+
+    def clean_column_names_inplace(self, df, copy=False):
+        """
+        Same cleaning as clean_column_names, applied as a rename on df itself.
+        Renaming only touches column metadata, so no data is duplicated unless
+        copy=True is requested by a caller that must keep its input untouched.
+        """
+        mapping = {col: self._clean_column_name(col) for col in df.columns}
+        mapping = {col: new for col, new in mapping.items() if new != col}
+        if not mapping:
+            # Already clean (the usual case on re-runs) - nothing to copy or rename
+            return df
+        if copy:
+            df = df.copy()
+        df.rename(columns=mapping, inplace=True)
         return df
 
     def map_dtype_to_postgresql(self, dtype):
@@ -333,11 +374,13 @@ class RDSConnectionManager:
         """Create a table based on DataFrame structure"""
         try:
             with self.get_cursor() as cursor:
-                # Clean the dataframe for column names
-                cleaned_df = self.clean_column_names(dataframe.copy())
-                columns = ', '.join([f"{col} {self.map_dtype_to_postgresql(dtype)}" 
-                                   for col, dtype in zip(cleaned_df.columns, dataframe.dtypes)])
+                # Only the column names need cleaning - no need to copy the data
+                columns = ', '.join([f"{self._clean_column_name(col)} {self.map_dtype_to_postgresql(dtype)}" 
+                                   for col, dtype in zip(dataframe.columns, dataframe.dtypes)])
 
+                # Concurrent CREATE TABLE IF NOT EXISTS can still race on the catalog
+                # (unique violation) - serialize per table across nodes for this transaction
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (table_name,))
                 create_query = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns});"
                 cursor.execute(create_query)
                 logger.info(f"Table {table_name} created successfully or already exists.")
@@ -365,7 +408,7 @@ class RDSConnectionManager:
         try:
             with self.get_cursor() as cursor:
                 # Clean column names
-                df = self.clean_column_names(df.copy())
+                df = self.clean_column_names_inplace(df, copy=True)
                 columns = df.columns
                 
                 # Prepare SQL query for inserting data
@@ -386,6 +429,42 @@ class RDSConnectionManager:
             logger.error(f"Error inserting data into {table_name}: {e}")
             raise
 
+    def copy_dataframe_to_rds(self, df, table_name):
+        """
+        Bulk load a DataFrame with COPY FROM STDIN instead of row-wise INSERTs
+        Column names must already be cleaned; df itself is not modified
+        """
+        try:
+            # Float columns holding whole numbers (ints upcast by NaNs) would be written
+            # as "1.0", which COPY rejects for INTEGER columns - write them as Int64
+            integral = {}
+            for col in df.columns:
+                if pd.api.types.is_float_dtype(df[col].dtype):
+                    values = df[col].dropna()
+                    if not values.empty and (values % 1 == 0).all():
+                        integral[col] = df[col].astype('Int64')
+            if integral:
+                df = df.assign(**integral)
+            
+            with self.get_cursor() as cursor:
+                # Explicit NULL marker: CSV COPY would otherwise load empty strings
+                # as NULL, which the row-wise INSERT path never did
+                buffer = io.StringIO()
+                df.to_csv(buffer, index=False, header=False, na_rep=COPY_NULL)
+                buffer.seek(0)
+                
+                copy_query = sql.SQL("COPY {table} ({fields}) FROM STDIN WITH (FORMAT csv, NULL {null})").format(
+                    null=sql.Literal(COPY_NULL),
+                    table=sql.Identifier(table_name),
+                    fields=sql.SQL(', ').join(map(sql.Identifier, df.columns))
+                )
+                cursor.copy_expert(copy_query, buffer)
+                logger.info(f"Data copied successfully into {table_name} table ({len(df)} rows).")
+                
+        except Exception as e:
+            logger.error(f"Error copying data into {table_name}: {e}")
+            raise
+
     def fetch_table_to_dataframe(self, table_name):
         """Fetch all data from a table as DataFrame"""
         try:
@@ -0,0 +1,159 @@
+"""
+On-disk cache of successful NBA API responses
+
+Each (endpoint, params) pair maps to one pickled list of DataFrames under
+cache/api_responses/<endpoint>/. Callers choose how old an entry may be, so
+finished seasons can be reused for weeks while live data is refetched.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from datetime import datetime, timedelta
+
+RESPONSE_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'api_responses')
+DEFAULT_TTL = timedelta(days=30)
+CURRENT_SEASON_TTL = timedelta(hours=6)
+
+
+def parse_cache_policy(policy):
+    """
+    Translate a cache policy string into a max entry age
+
+    Args:
+        policy: 'alwaysRefresh', 'neverRefresh' or 'refreshAfterDays=N'
+
+    Returns:
+        timedelta or None: None means never read from the cache
+    """
+    if policy == 'alwaysRefresh':
+        return None
+    if policy == 'neverRefresh':
+        # Finished seasons never change; ttl_for_params still expires the current one
+        return timedelta.max
+    if policy.startswith('refreshAfterDays='):
+        return timedelta(days=float(policy.split('=', 1)[1]))
+    raise ValueError(f"Unknown cache policy: {policy}")
+
+
+def ttl_for_params(params, current_season, default_ttl=DEFAULT_TTL):
+    """Current-season data still changes, so it expires much sooner"""
+    if default_ttl is None:
+        return None
+    if current_season in params.values():
+        return min(default_ttl, CURRENT_SEASON_TTL)
+    return default_ttl
+
+
+def _cache_path(endpoint_name, params):
+    """Cache file for one (endpoint, params) pair - key is stable across runs"""
+    key = json.dumps(sorted(params.items()), default=str)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(RESPONSE_CACHE_DIR, endpoint_name.lower(), f"{digest}.pkl")
+
+
+def load_cached_response(endpoint_name, params, ttl, logger):
+    """
+    Return cached dataframes for these params, or None if missing/expired
+
+    Args:
+        ttl: Max entry age (timedelta); None skips the cache entirely
+
+    Returns:
+        list or None: The dataframes stored by save_cached_response
+    """
+    if ttl is None:
+        return None
+
+    path = _cache_path(endpoint_name, params)
+    try:
+        age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(path))
+    except OSError:
+        return None
+    if age > ttl:
+        return None
+
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable response cache {path}: {e}")
+        return None
+
+
+def save_cached_response(endpoint_name, params, dataframes, logger):
+    """Store successful dataframes for reuse by later runs"""
+    path = _cache_path(endpoint_name, params)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so a killed job never leaves a truncated pickle behind
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(dataframes, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not write response cache {path}: {e}")
+
+
+# Digest of the last response that was stored for each (endpoint, params) key.
+# Append-only JSONL: one {"key", "digest"} record per stored response, later
+# records win, so a batch costs one small append instead of a full rewrite.
+MANIFEST_FILE = os.path.join(os.path.dirname(RESPONSE_CACHE_DIR), 'response_manifest.jsonl')
+# Whole-dict manifest written before the switch to JSONL; read as the base layer
+LEGACY_MANIFEST_FILE = os.path.join(os.path.dirname(RESPONSE_CACHE_DIR), 'response_manifest.json')
+
+
+def response_digest(raw_response):
+    """Content hash of a raw API response body"""
+    if isinstance(raw_response, str):
+        raw_response = raw_response.encode('utf-8')
+    return hashlib.sha1(raw_response).hexdigest()
+
+
+def manifest_key(endpoint_name, params):
+    """Stable manifest key for one (endpoint, params) pair"""
+    return f"{endpoint_name}:{json.dumps(sorted(params.items()), default=str)}"
+
+
+def load_manifest():
+    """Load the response manifest ({key: digest}); empty if none yet"""
+    manifest = {}
+    try:
+        with open(LEGACY_MANIFEST_FILE, 'r') as f:
+            manifest.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(MANIFEST_FILE, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    manifest[record['key']] = record['digest']
+                except (ValueError, KeyError, TypeError):
+                    continue  # Torn line from a killed job
+    except OSError:
+        pass
+    return manifest
+
+
+def append_manifest(digests, logger):
+    """
+    Record newly stored digests in the manifest
+
+    Args:
+        digests: {key: digest} for the responses just written to the database
+    """
+    lines = ''.join(json.dumps({'key': key, 'digest': digest}) + '\n'
+                    for key, digest in digests.items())
+    try:
+        os.makedirs(os.path.dirname(MANIFEST_FILE), exist_ok=True)
+        # One write per batch keeps concurrent appenders from interleaving records
+        with open(MANIFEST_FILE, 'a+b') as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    lines = '\n' + lines  # Don't glue the first record onto a torn line
+            f.write(lines.encode('utf-8'))
+    except OSError as e:
+        logger.warning(f"Could not update response manifest: {e}")
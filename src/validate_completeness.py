@@ -19,6 +19,8 @@ Three endpoint categories, three different checks:
 """
 
 import json
+from typing import NamedTuple
+
 import psycopg2
 
 # endpoint -> primary data table (the "_a" shard is the completeness indicator)
@@ -44,10 +46,16 @@ MASTER_BUILDERS = {
     'LeagueGameFinder':   'master_nba_games',
 }
 
+class KeyedTable(NamedTuple):
+    """Data table plus the column list that identifies one logical record"""
+    table: str
+    key: str
+
+
 OTHER = {
-    'LeagueSeasonMatchups': {'table': 'nba_leagueseasonmatchups_a', 'key': 'season'},
-    'CommonTeamRoster':     {'table': 'nba_commonteamroster_a',     'key': 'teamid, season'},
-    'TeamGameLogs':         {'table': 'nba_teamgamelogs_a',         'key': 'teamid, seasonyear'},
+    'LeagueSeasonMatchups': KeyedTable('nba_leagueseasonmatchups_a', 'season'),
+    'CommonTeamRoster':     KeyedTable('nba_commonteamroster_a',     'teamid, season'),
+    'TeamGameLogs':         KeyedTable('nba_teamgamelogs_a',         'teamid, seasonyear'),
 }
 
 PLAYER_DASH_PREREQ_TABLE = 'nba_playergamelogs_a'
@@ -63,18 +71,29 @@ def connect():
     )
 
 
-def check_per_game(cur, data_table):
+def build_game_universe(cur):
+    """Materialize the master gameids once; every per-game check reuses it. Returns its size."""
+    cur.execute("""
+        CREATE TEMP TABLE game_universe AS
+            SELECT DISTINCT gameid FROM master_nba_games WHERE gameid IS NOT NULL;
+        CREATE INDEX ON game_universe (gameid);
+        ANALYZE game_universe;
+    """)
+    cur.execute('SELECT COUNT(*) FROM game_universe')
+    return cur.fetchone()[0]
+
+
+def check_per_game(cur, data_table, universe):
     """Returns (universe, present, missing). Missing = master gameids not in data."""
     cur.execute(f"""
-        WITH universe AS (SELECT DISTINCT gameid FROM master_nba_games),
-             present AS (SELECT DISTINCT gameid FROM {data_table})
+        WITH present AS (SELECT DISTINCT gameid FROM {data_table})
         SELECT
-          (SELECT COUNT(*) FROM universe),
           (SELECT COUNT(*) FROM present),
-          (SELECT COUNT(*) FROM universe u
+          (SELECT COUNT(*) FROM game_universe u
              WHERE NOT EXISTS (SELECT 1 FROM present p WHERE p.gameid = u.gameid))
     """)
-    return cur.fetchone()
+    present, missing = cur.fetchone()
+    return universe, present, missing
 
 
 def check_other(cur, table, key):
@@ -84,8 +103,9 @@ def check_other(cur, table, key):
 
 def table_exists(cur, name):
     cur.execute(
-        "SELECT EXISTS (SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema='public' AND table_name=%s)", (name,))
+        "SELECT EXISTS (SELECT 1 FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid=c.relnamespace "
+        "WHERE n.nspname='public' AND c.relname=%s AND c.relkind IN ('r','p'))", (name,))
     return cur.fetchone()[0]
 
 
@@ -108,17 +128,31 @@ def main():
     print(f"{'Endpoint':<22}{'Master table':<28}{'Rows':>12}")
     print('-' * 100)
     for ep, mt in MASTER_BUILDERS.items():
-        cur.execute(f'SELECT COUNT(*) FROM {mt}')
-        print(f'{ep:<22}{mt:<28}{cur.fetchone()[0]:>12}')
+        try:
+            cur.execute(f'SELECT COUNT(*) FROM {mt}')
+            print(f'{ep:<22}{mt:<28}{cur.fetchone()[0]:>12}')
+        except Exception as e:
+            conn.rollback()
+            print(f'{ep:<22}{mt:<28}  ERROR: {e}')
 
     print(f"\n{'='*100}")
     print(f"{'PER-GAME ENDPOINTS':^100}")
     print(f"{'='*100}")
     print(f"{'Endpoint':<28}{'Universe':>10}{'Present':>10}{'Missing':>10}  Verdict")
     print('-' * 100)
+    try:
+        universe = build_game_universe(cur)
+        conn.commit()  # Keep the temp table if a later check fails and rolls back
+    except Exception as e:
+        conn.rollback()
+        universe = None
+        print(f"{'(game universe)':<28}  ERROR: {e}")
     for ep, dt in PER_GAME.items():
+        if universe is None:
+            print(f'{ep:<28}  SKIPPED: no game universe')
+            continue
         try:
-            u, pres, miss = check_per_game(cur, dt)
+            u, pres, miss = check_per_game(cur, dt, universe)
             print(f'{ep:<28}{u:>10}{pres:>10}{miss:>10}  {verdict(u, pres, miss)}')
         except Exception as e:
             conn.rollback()
@@ -131,18 +165,18 @@ def main():
     print('-' * 100)
     for ep, info in OTHER.items():
         try:
-            rows, distinct = check_other(cur, info['table'], info['key'])
-            print(f'{ep:<28}{info["table"]:<36}{rows:>10}{distinct:>15}  ({info["key"]})')
+            rows, distinct = check_other(cur, info.table, info.key)
+            print(f'{ep:<28}{info.table:<36}{rows:>10}{distinct:>15}  ({info.key})')
         except Exception as e:
             conn.rollback()
-            print(f'{ep:<28}{info["table"]:<36}  ERROR: {e}')
+            print(f'{ep:<28}{info.table:<36}  ERROR: {e}')
 
     print(f"\n{'='*100}")
     print(f"{'PREREQUISITE-GATED ENDPOINTS':^100}")
     print(f"{'='*100}")
     prereq_ok = table_exists(cur, PLAYER_DASH_PREREQ_TABLE)
+    status = 'READY' if prereq_ok else f'BLOCKED — needs {PLAYER_DASH_PREREQ_TABLE}'
     for ep in PLAYER_DASH_ENDPOINTS:
-        status = 'READY' if prereq_ok else f'BLOCKED — needs {PLAYER_DASH_PREREQ_TABLE}'
         print(f'  {ep}: {status}')
 
     conn.close()